@@ -0,0 +1,58 @@
+import threading
+from collections import OrderedDict
+
+# at most this many distinct client settings keep a pooled client; the least recently used is dropped beyond it
+_POOL_SIZE = 8
+
+_pool: OrderedDict = OrderedDict()
+_pool_lock = threading.Lock()
+
+
+def _pool_key(value):
+    """Returns a hashable key for a client setting, freezing dicts, lists and option models.
+
+    Raises:
+        TypeError: If the setting holds a value that cannot be hashed.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, _pool_key(item)) for key, item in value.items()))
+    if isinstance(value, list | tuple):
+        return tuple(_pool_key(item) for item in value)
+    # GenAI option objects (e.g. HttpOptions) are pydantic models, which compare by their fields
+    if hasattr(value, "model_dump"):
+        return (type(value).__name__, _pool_key(value.model_dump()))
+    hash(value)
+    return value
+
+
+def get_genai_client(**client_kwargs):
+    """Return a GenAI client for the given settings, reusing a pooled client where possible.
+
+    Vectorisers and hooks created with the same client settings share one
+    client, and so share its HTTP connection pool and authentication, rather
+    than each setting up their own.
+
+    Args:
+        **client_kwargs: Keyword arguments to pass to `genai.Client`.
+
+    Returns:
+        genai.Client: The GenAI client.
+    """
+    from google import genai  # type: ignore
+
+    try:
+        key = _pool_key(client_kwargs)
+    except TypeError:
+        # settings holding unhashable values (e.g. custom HTTP clients) can't be pooled, so get their own client
+        return genai.Client(**client_kwargs)
+
+    with _pool_lock:
+        if key in _pool:
+            _pool.move_to_end(key)
+            return _pool[key]
+
+        client = genai.Client(**client_kwargs)
+        _pool[key] = client
+        if len(_pool) > _POOL_SIZE:
+            _pool.popitem(last=False)
+        return client
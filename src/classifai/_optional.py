@@ -1,4 +1,6 @@
-from importlib.metadata import PackageNotFoundError, version
+import re
+from functools import lru_cache
+from importlib.metadata import distributions
 
 
 class OptionalDependencyError(ImportError):
@@ -18,6 +20,23 @@ def _message(req: str | list[str], extra: str | None) -> str:
     )
 
 
+# package names compare case-insensitively with runs of '-', '_' and '.' treated alike (PEP 503)
+_NAME_SEPARATORS = re.compile(r"[-_.]+")
+
+
+def _normalise(name: str) -> str:
+    return _NAME_SEPARATORS.sub("-", name).lower()
+
+
+@lru_cache(maxsize=1)
+def _installed_packages() -> frozenset[str]:
+    """Returns the normalised names of all installed distributions.
+
+    The scan is cached, and only repeated when check_deps finds a package missing.
+    """
+    return frozenset(_normalise(name) for dist in distributions() if (name := dist.metadata["Name"]))
+
+
 def check_deps(reqs: list[str], extra: str | None = None) -> None:
     """Check if optional dependencies are installed.
 
@@ -28,11 +47,11 @@ def check_deps(reqs: list[str], extra: str | None = None) -> None:
     Raises:
         OptionalDependencyError: If any of the required packages are not installed.
     """
-    missing = []
-    for req in reqs:
-        try:
-            version(req)
-        except PackageNotFoundError:
-            missing.append(req)
+    missing = [req for req in reqs if _normalise(req) not in _installed_packages()]
+    if missing:
+        # the package may have been installed since the last scan (e.g. with %pip in a notebook), so rescan once
+        _installed_packages.cache_clear()
+        installed = _installed_packages()
+        missing = [req for req in missing if _normalise(req) not in installed]
     if missing:
         raise OptionalDependencyError(_message(missing, extra))
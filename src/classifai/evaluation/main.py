@@ -277,7 +277,8 @@ class Evaluation:
             raise ValueError("output_file must be a string and end with '.csv'.")
 
         # Run evaluation
-        overall_results_df = pd.DataFrame()
+        # metrics are collected per VectorStore and framed once at the end, rather than concatenated on every iteration
+        vectorstore_metrics: list[dict] = []
 
         # Process each VectorStore instance or callable and corresponding name
         for vs, name in zip(vectorstores, vectorstore_names, strict=False):
@@ -316,9 +317,10 @@ class Evaluation:
                     context={"vectorstore_name": name, "cause_message": str(e)},
                 ) from e
 
-            # Append the current VectorStore's metrics to the overall results DataFrame
-            vectorstore_df = pd.DataFrame([self.metric_results], index=[name])
-            overall_results_df = pd.concat([overall_results_df, vectorstore_df])
+            # Record a copy of the current VectorStore's metrics, as metric_results is updated by the next VectorStore
+            vectorstore_metrics.append(dict(self.metric_results))
+
+        overall_results_df = pd.DataFrame(vectorstore_metrics, index=vectorstore_names)
 
         # Save results to CSV if requested
         if self.save_output:
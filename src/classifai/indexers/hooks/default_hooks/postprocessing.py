@@ -1,10 +1,12 @@
 import io
 import json
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 import numpy as np
-import pandas as pd
 
+from classifai._genai import get_genai_client
 from classifai._optional import check_deps
 from classifai.exceptions import ConfigurationError, HookError
 from classifai.indexers.dataclasses import VectorStoreSearchOutput
@@ -90,11 +92,11 @@ class DeduplicationHook(HookBase):
             .reset_index()
         )
         # For each query, re-assign ranks based on the new aggregated scores, to the remaining entries, to ensure that the best
-        # scoring entry for each label is ranked highest.
-        for query in df_gpby["query_id"].unique():
-            batch = df_gpby[df_gpby["query_id"] == query]
-            new_rank = pd.factorize(-batch["score"], sort=True)[0] + 1
-            df_gpby.loc[batch.index, "rank"] = new_rank
+        # scoring entry for each label is ranked highest. A dense rank of descending score within each query group does this
+        # for every query in one pass, rather than filtering the whole frame once per query.
+        df_gpby["rank"] = (
+            df_gpby.groupby("query_id", sort=False)["score"].rank(method="dense", ascending=False).astype("int64")
+        )
         # Finally, we re-merge the deduplicated results with the original input dataframe,
         # to retrieve the metadata of the best scoring entry for each label, and return the processed output.
         for col in set(input_data.columns).difference(set(df_gpby.columns)):
@@ -127,6 +129,8 @@ class RagHook(HookBase):
             GenerateContentConfig class used to configure LLM calls.
         client_kwargs (dict): Keyword arguments used to initialise the GenAI
             client.
+        max_concurrency (int): The maximum number of queries sent to the LLM
+            at once.
     """
 
     def __init__(  # noqa: PLR0913
@@ -138,6 +142,8 @@ class RagHook(HookBase):
         api_key: str | None = None,
         location: str = "europe-west2",
         model_name: str = "gemini-2.5-flash",
+        *,
+        max_concurrency: int = 8,
         **client_kwargs,
     ):
         """Initialises the hook with the specified LLM and prompt configuration.
@@ -162,21 +168,30 @@ class RagHook(HookBase):
                 Defaults to "europe-west2".
             model_name (str): The name of the generative model. Defaults to
                 "gemini-2.5-flash".
+            max_concurrency (int): The maximum number of queries sent to the
+                LLM at once. Defaults to 8.
             **client_kwargs: Additional keyword arguments to pass to the
                 GenAI client, e.g. vertexai=True.
 
         Raises:
             ConfigurationError: If both or neither of project_id and
-                api_key are provided, or if the GenAI client fails to
-                initialise.
+                api_key are provided, if max_concurrency is not a positive
+                integer, or if the GenAI client fails to initialise.
         """
         check_deps(["google-genai"], extra="gcp")
         from google import genai  # type: ignore
 
+        if not isinstance(max_concurrency, int) or max_concurrency < 1:
+            raise ConfigurationError(
+                "max_concurrency must be an integer >= 1.",
+                context={"hooks": "RAG", "max_concurrency": max_concurrency},
+            )
+
         self.model_name = model_name
         self.context_prompt = context_prompt
         self.response_template = response_template
         self.llm_response_parser = llm_response_parser or self._default_parse_LLM_response
+        self.max_concurrency = max_concurrency
 
         if project_id and not api_key:
             client_kwargs.setdefault("project", project_id)
@@ -192,7 +207,7 @@ class RagHook(HookBase):
         self.client_kwargs = client_kwargs
 
         try:
-            self.client = genai.Client(**self.client_kwargs)  # .aio
+            self.client = get_genai_client(**self.client_kwargs)
             self.config_generator = genai.types.GenerateContentConfig  # type: ignore
         except Exception as e:
             raise ConfigurationError(
@@ -200,7 +215,26 @@ class RagHook(HookBase):
                 context={"hooks": "RAG", "cause": str(e), "cause_type": type(e).__name__},
             ) from e
 
-    def _format_prompt_single_query(self, search_subset: VectorStoreSearchOutput, query_id: str):
+    @staticmethod
+    def _schema_info(search_subset: VectorStoreSearchOutput) -> str:
+        """Describes the columns and dtypes of the search output for the prompt.
+
+        Args:
+            search_subset (VectorStoreSearchOutput): The search output, or a
+                subset of it, to describe.
+
+        Returns:
+            str: The DataFrame.info() summary of the (empty) search output.
+        """
+        schema_info_buffer = io.StringIO()
+        search_subset.head(n=0).info(verbose=True, show_counts=False, memory_usage=False, buf=schema_info_buffer)
+        schema_info = schema_info_buffer.getvalue()
+        schema_info_buffer.close()
+        return schema_info
+
+    def _format_prompt_single_query(
+        self, search_subset: VectorStoreSearchOutput, query_id: str, schema_info: str | None = None
+    ):
         """Formats a prompt for the LLM to process results for a single query.
 
         The prompt includes instructions, the search output schema,
@@ -211,14 +245,15 @@ class RagHook(HookBase):
                 output corresponding to a single query.
             query_id (str): The ID of the query corresponding to the search
                 subset, used for prompt formatting.
+            schema_info (str | None): The schema description of the search
+                output, shared by every query. Derived from search_subset if
+                None. Defaults to None.
 
         Returns:
             str: The formatted prompt string for the LLM.
         """
-        schema_info_buffer = io.StringIO()
-        search_subset.head(n=0).info(verbose=True, show_counts=False, memory_usage=False, buf=schema_info_buffer)
-        schema_info = schema_info_buffer.getvalue()
-        schema_info_buffer.close()
+        if schema_info is None:
+            schema_info = self._schema_info(search_subset)
         return f"""
         Instructions:
         -------------
@@ -281,12 +316,36 @@ class RagHook(HookBase):
             ) from None
         return parsed_response
 
+    def _call_llm_single_query(
+        self, search_subset: VectorStoreSearchOutput, query_id: str, schema_info: str | None = None
+    ) -> list[str]:
+        """Calls the LLM for a single query and parses its response.
+
+        Args:
+            search_subset (VectorStoreSearchOutput): The subset of the search
+                output corresponding to a single query.
+            query_id (str): The ID of the query corresponding to the search
+                subset.
+            schema_info (str | None): The schema description of the search
+                output, passed on to the prompt. Defaults to None.
+
+        Returns:
+            The parsed LLM response, with one value per row of search_subset.
+        """
+        prompt = self._format_prompt_single_query(search_subset, query_id, schema_info)
+        response = self.client.models.generate_content(
+            model=self.model_name,
+            contents=prompt,
+            config=self.config_generator(system_instruction=self.context_prompt),
+        )
+        return self.llm_response_parser(search_subset, response.text)
+
     def _call_llm(self, search_output: VectorStoreSearchOutput) -> VectorStoreSearchOutput:
         """Calls the LLM for each query in the search output and collects responses.
 
-        Iterates over each unique query in search_output, formats a
-        prompt using _format_prompt_single_query, calls the LLM, and
-        parses the response using llm_response_parser.
+        Each unique query in search_output is sent to the LLM using
+        _call_llm_single_query. The calls spend most of their time waiting
+        on the network, so up to `max_concurrency` queries are sent at once.
 
         Args:
             search_output (VectorStoreSearchOutput): The output from the
@@ -298,18 +357,23 @@ class RagHook(HookBase):
         """
         updated_search_output = search_output.copy()
         updated_search_output["RAG_response"] = ""
-        distinct_queries = search_output["query_id"].unique()
-        for query_id in distinct_queries:
-            search_subset = search_output[search_output["query_id"] == query_id]
-            prompt = self._format_prompt_single_query(search_subset, query_id)
-            response = self.client.models.generate_content(  # await ...
-                model=self.model_name,
-                contents=prompt,
-                config=self.config_generator(system_instruction=self.context_prompt),
-            )
-            updated_search_output.loc[search_subset.index, "RAG_response"] = self.llm_response_parser(
-                search_subset, response.text
+        # a single groupby pass splits the output by query, rather than masking the whole output once per query
+        query_groups = list(search_output.groupby("query_id", sort=False, dropna=False))
+        if len(query_groups) == 0:
+            return updated_search_output
+
+        distinct_queries = [query_id for query_id, _ in query_groups]
+        search_subsets = [search_subset for _, search_subset in query_groups]
+        # every subset has the same columns, so the schema part of the prompt is rendered once for all queries
+        schema_info = self._schema_info(search_subsets[0])
+
+        # threads rather than asyncio, so the hook can still run inside a running event loop
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(search_subsets))) as pool:
+            responses = pool.map(
+                partial(self._call_llm_single_query, schema_info=schema_info), search_subsets, distinct_queries
             )
+            for search_subset, response in zip(search_subsets, responses, strict=True):
+                updated_search_output.loc[search_subset.index, "RAG_response"] = response
         return updated_search_output
 
     def __call__(self, search_output: VectorStoreSearchOutput) -> VectorStoreSearchOutput:
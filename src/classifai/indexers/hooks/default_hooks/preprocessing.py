@@ -46,6 +46,8 @@ class CapitalisationStandardisingHook(HookBase):
             self.method = lambda text: text.capitalize() if text else text
         elif method == "title":
             self.method = str.title
+        # the matching pandas string method, so whole columns are transformed in one call rather than row by row
+        self._str_method = "capitalize" if method == "sentence" else method
         self.colname = colname
 
     def __call__(
@@ -80,7 +82,7 @@ class CapitalisationStandardisingHook(HookBase):
 
         processed_input = input_data.copy()
         for col in self.colname:
-            processed_input[col] = processed_input[col].apply(self.method)
+            processed_input[col] = getattr(processed_input[col].str, self._str_method)()
         # Ensure the processed input still conforms to the schema
         processed_input = input_data.__class__.validate(processed_input)
         return processed_input
@@ -39,8 +39,10 @@ VectorStore Class:
 import json
 import logging
 import os
+import tempfile
 import time
-import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 import fsspec
 import numpy as np
@@ -67,7 +69,230 @@ from .dataclasses import (
     VectorStoreSearchOutput,
 )
 
+logger = logging.getLogger(__name__)
+
 _BATCH_SIZE = 128
+# small enough for an upcast float32 tile of typical embedding widths to stay in cache during the matmul
+_QUANTISED_TILE_SIZE = 1024
+# pin the vectors.parquet codec rather than relying on the polars default; zstd compresses the string columns well,
+# and level 1 writes faster than higher levels since the float embeddings barely compress at any level
+_PARQUET_COMPRESSION = "zstd"
+_PARQUET_COMPRESSION_LEVEL = 1
+# below this many vectors an exact matmul is as fast as an approximate index, so search stays exact
+_ANN_MIN_VECTORS = 10_000
+_HNSW_M = 16
+# very large indexes need more links per node to keep recall up at the same ef
+_HNSW_M_LARGE = 32
+_HNSW_LARGE_INDEX_VECTORS = 1_000_000
+_HNSW_EF_CONSTRUCTION = 200
+_HNSW_EF_SEARCH = 64
+_HNSW_INDEX_FILE = "hnsw_index.bin"
+# columns the VectorStore itself stores in its vectors table, which meta_data columns must not shadow
+_RESERVED_COLUMNS = ("label", "text", "uuid", "embeddings", "embeddings_scale", "norm")
+_HEX_DIGITS = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+
+
+def _set_log_verbosity(quiet_mode: bool):
+    """Sets the verbosity of this module's logger without reconfiguring the root logger.
+
+    The level is applied to the module logger only, so the application's own
+    logging configuration decides where the messages go and which other
+    loggers are shown.
+
+    Args:
+        quiet_mode (bool): If True, only warnings and errors are logged.
+            Otherwise informational progress messages are logged too.
+    """
+    logger.setLevel(logging.WARNING if quiet_mode else logging.INFO)
+
+
+def _quantise_int8(embeddings: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Symmetrically quantises each embedding row to int8 with its own scale factor.
+
+    Args:
+        embeddings (np.ndarray): A 2D array of embeddings, one row per document.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The int8 quantised embeddings, and the
+            float32 per-row scale factors such that `quantised * scale`
+            approximately recovers the original embeddings.
+    """
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    scales = np.max(np.abs(embeddings), axis=1) / 127
+    scales[scales == 0] = 1.0  # all-zero rows would otherwise divide by zero
+    quantised = np.round(embeddings / scales[:, None]).astype(np.int8)
+    return quantised, scales.astype(np.float32)
+
+
+def _uuid4_series(count: int) -> pl.Series:
+    """Generates a column of random version 4 UUID strings in bulk.
+
+    The same format as `str(uuid.uuid4())`, but the random bytes for every row
+    come from one `os.urandom` call and are hex-formatted with array
+    operations, rather than creating and formatting one UUID object per row.
+
+    Args:
+        count (int): The number of UUIDs to generate.
+
+    Returns:
+        pl.Series: A string Series named "uuid" holding `count` UUIDs.
+    """
+    raw = np.frombuffer(os.urandom(16 * count), dtype=np.uint8).reshape(count, 16).copy()
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40  # version 4
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+    nibbles = np.empty((count, 32), dtype=np.uint8)
+    nibbles[:, 0::2] = raw >> 4
+    nibbles[:, 1::2] = raw & 0x0F
+    digits = _HEX_DIGITS[nibbles]
+
+    # 8-4-4-4-12 hex digits separated by dashes
+    chars = np.full((count, 36), ord("-"), dtype=np.uint8)
+    chars[:, 0:8] = digits[:, 0:8]
+    chars[:, 9:13] = digits[:, 8:12]
+    chars[:, 14:18] = digits[:, 12:16]
+    chars[:, 19:23] = digits[:, 16:20]
+    chars[:, 24:36] = digits[:, 20:32]
+    return pl.Series("uuid", chars.view("S36").ravel()).cast(pl.String)
+
+
+def _dequantised_scores(
+    query_vectors: np.ndarray, quantised: np.ndarray, scales: np.ndarray, tile_size: int = _QUANTISED_TILE_SIZE
+) -> np.ndarray:
+    """Scores queries against int8 quantised documents, one tile of documents at a time.
+
+    Only a single tile of documents is ever upcast to float32, into one
+    reused buffer, so the full precision document matrix is never
+    materialised in memory. Scores are written straight into the output.
+
+    Args:
+        query_vectors (np.ndarray): A 2D array of query embeddings.
+        quantised (np.ndarray): A 2D int8 array of quantised document embeddings.
+        scales (np.ndarray): The per-document scale factors for `quantised`.
+        tile_size (int): The number of documents to dequantise at once.
+
+    Returns:
+        np.ndarray: A (n_queries, n_documents) float32 array of dot-product scores.
+    """
+    query_vectors = np.asarray(query_vectors, dtype=np.float32)
+    scores = np.empty((query_vectors.shape[0], quantised.shape[0]), dtype=np.float32)
+    tile_buffer = np.empty((min(tile_size, quantised.shape[0]), quantised.shape[1]), dtype=np.float32)
+    for start in range(0, quantised.shape[0], tile_size):
+        block = quantised[start : start + tile_size]
+        tile = tile_buffer[: len(block)]
+        np.copyto(tile, block, casting="unsafe")
+        np.matmul(query_vectors, tile.T, out=scores[:, start : start + len(block)])
+    scores *= scales
+    return scores
+
+
+def _exact_top_k(
+    query_vectors: np.ndarray,
+    doc_embeddings: np.ndarray,
+    n_results: int,
+    doc_scales: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Scores queries against every document and returns the top n_results for each query.
+
+    Args:
+        query_vectors (np.ndarray): A 2D array of query embeddings.
+        doc_embeddings (np.ndarray): A 2D array of document embeddings, either
+            float32 or int8 quantised.
+        n_results (int): The number of top documents to return per query, at
+            most the number of documents.
+        doc_scales (np.ndarray | None): Per-document factors the raw scores
+            are multiplied by: the scale factors of int8 quantised embeddings
+            and/or the inverse document norms for the cosine metric. Required
+            for int8 embeddings; None if full precision scores need no scaling.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The (n_queries, n_results) document
+            indices and scores, ordered by descending score.
+    """
+    if doc_embeddings.dtype == np.int8:
+        cosine = _dequantised_scores(query_vectors, doc_embeddings, doc_scales)
+    else:
+        cosine = query_vectors @ doc_embeddings.T
+        if doc_scales is not None:
+            cosine *= doc_scales
+
+    if n_results < cosine.shape[1]:
+        idx = np.argpartition(cosine, -n_results, axis=1)[:, -n_results:]
+    else:
+        # every document is returned, so there is nothing to partition
+        idx = np.broadcast_to(np.arange(cosine.shape[1]), cosine.shape)
+
+    # sort every query's top-k in one batched call on the negated (k-wide) scores, which orders them
+    # descending without negating the full score matrix or reversing the sorted indices
+    partitioned_scores = np.take_along_axis(cosine, idx, axis=1)
+    order = np.argsort(-partitioned_scores, axis=1, kind="stable")
+    idx_sorted = np.take_along_axis(idx, order, axis=1)
+    scores = np.take_along_axis(partitioned_scores, order, axis=1)
+
+    return idx_sorted, scores
+
+
+def _build_hnsw_index(doc_matrix: np.ndarray):
+    """Builds an HNSW approximate nearest neighbour index over document embeddings.
+
+    The index scores by inner product for both metrics: for the cosine metric
+    the document matrix passed in is L2-normalised, and query vectors are
+    normalised before searching, so hnswlib doesn't need to normalise them
+    again.
+
+    Args:
+        doc_matrix (np.ndarray): A 2D float32 array of document embeddings,
+            where the row position is used as the document's label in the
+            index.
+
+    Returns:
+        hnswlib.Index: The populated index.
+    """
+    import hnswlib  # type: ignore
+
+    index = hnswlib.Index(space="ip", dim=doc_matrix.shape[1])
+    num_vectors = doc_matrix.shape[0]
+    links = _HNSW_M_LARGE if num_vectors >= _HNSW_LARGE_INDEX_VECTORS else _HNSW_M
+    index.init_index(max_elements=num_vectors, M=links, ef_construction=_HNSW_EF_CONSTRUCTION)
+    index.add_items(doc_matrix, np.arange(doc_matrix.shape[0]))
+    return index
+
+
+def _save_hnsw_index(index, path: str):
+    """Saves an HNSW index to a local or remote path via a temporary local file.
+
+    Args:
+        index (hnswlib.Index): The index to save.
+        path (str): The destination path, which may be any fsspec-supported
+            location.
+    """
+    out_fs, out_path = fsspec.core.url_to_fs(path)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        local_path = os.path.join(tmp_dir, _HNSW_INDEX_FILE)
+        index.save_index(local_path)
+        out_fs.put_file(local_path, out_path)
+
+
+def _load_hnsw_index(path: str, dim: int):
+    """Loads an HNSW index from a local or remote path via a temporary local file.
+
+    Args:
+        path (str): The path of the saved index, which may be any
+            fsspec-supported location.
+        dim (int): The number of dimensions in the indexed embeddings.
+
+    Returns:
+        hnswlib.Index: The loaded index.
+    """
+    import hnswlib  # type: ignore
+
+    in_fs, in_path = fsspec.core.url_to_fs(path)
+    # indexes saved with the cosine space hold the same normalised vectors, so they load unchanged
+    index = hnswlib.Index(space="ip", dim=dim)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        local_path = os.path.join(tmp_dir, _HNSW_INDEX_FILE)
+        in_fs.get_file(in_path, local_path)
+        index.load_index(local_path)
+    return index
 
 
 class VectorStore:
@@ -109,6 +334,14 @@ class VectorStore:
             postprocessing.
         quiet_mode (bool): Whether to minimise verbose output, such as progress
             bars.
+        quantise (str | None): The quantisation applied to the stored
+            embeddings, either None (full precision) or "int8".
+        metric (str): The similarity metric used by `.search()`, either "dot"
+            or "cosine".
+        index (str): The search index type, either "exact" (brute-force) or
+            "hnsw" (approximate nearest neighbour).
+        num_workers (int): The number of threads used to embed batches when
+            building the `VectorStore`.
     """
 
     def __init__(  # noqa: C901, PLR0912, PLR0913, PLR0915
@@ -123,6 +356,11 @@ class VectorStore:
         skip_save: bool = False,
         hooks: dict | None = None,
         quiet_mode: bool = False,
+        *,
+        quantise: str | None = None,
+        metric: str = "dot",
+        index: str = "exact",
+        num_workers: int = 1,
     ):
         """Generates vector embeddings from the input csv to form a `VectorStore`.
 
@@ -137,7 +375,8 @@ class VectorStore:
                 embedding. Defaults to 128.
             meta_data (dict | None): Mapping of extra CSV column names to
                 extract to their Python types (e.g. {"source": str}). Values
-                are Python types.
+                are Python types. The names "label", "text", "uuid",
+                "embeddings", "embeddings_scale" and "norm" are reserved.
             output_dir (str | None): Directory where vectors.parquet and
                 metadata.json are written. Defaults to the input file stem when
                 None is passed. Ignored when skip_save=True.
@@ -151,32 +390,53 @@ class VectorStore:
                 and postprocessing.
             quiet_mode (bool): Whether to minimise verbose output, such as
                 progress bars.
+            quantise (str | None): Quantisation to apply to the stored
+                embeddings. Pass "int8" to store each embedding as int8 values
+                with a per-row scale factor, reducing the size of the saved
+                `VectorStore` and the memory read during `.search()` roughly
+                4x, at a small cost in score precision. Defaults to None (full
+                precision).
+            metric (str): Similarity metric used by `.search()`. "dot" scores
+                documents by the raw dot product of the embeddings, while
+                "cosine" divides by the L2 norms of the query and document
+                embeddings. Document norms are computed once when the index is
+                built and saved alongside the embeddings, so they are not
+                recomputed when the `VectorStore` is reloaded. Defaults to
+                "dot".
+            index (str): Search index type. "exact" scores every query against
+                every document. "hnsw" builds an approximate nearest neighbour
+                index (requires the `ann` extra) that `.search()` uses once the
+                `VectorStore` holds at least 10,000 vectors, trading a small
+                amount of recall for much faster searches on large stores. The
+                index is built when the `VectorStore` is created and saved
+                alongside the vectors. Defaults to "exact".
+            num_workers (int): The number of threads used to embed batches in
+                parallel while building the `VectorStore`. Values above 1 help
+                most with vectorisers that call a remote service. Defaults to 1
+                (sequential).
 
         Raises:
             ClassifaiError: For any unexpected errors during initialisation,
                 with context for debugging.
-            DataValidationError: If input arguments are invalid or if there are
-                issues with the input file.
+            DataValidationError: If input arguments are invalid (including
+                meta_data columns with reserved names) or if there are issues
+                with the input file.
             ConfigurationError: If there are configuration issues, such as
                 output directory problems.
             IndexBuildError: If there are failures during index building or
                 saving outputs.
             OptionalDependencyError: If the user attempts to use a gs:// path
-                without having gcsfs installed.
+                without having gcsfs installed, or requests an "hnsw" index
+                without having hnswlib installed.
         """
         # ---- Set verbosity (based on quiet_mode argument)
 
         self.quiet_mode = quiet_mode
         if self.quiet_mode:
             self.classifai_tqdm = lambda iterable, *args, **kwargs: iterable
-            logging.basicConfig(level=logging.WARNING, format="%(levelname)s - %(message)s", force=True)
         else:
             self.classifai_tqdm = tqdm
-            logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s", force=True)
-
-        logging.getLogger("httpcore").setLevel(logging.WARNING)
-        logging.getLogger("httpx").setLevel(logging.WARNING)
-        logging.getLogger("urllib3.connectionpool").setLevel(logging.WARNING)
+        _set_log_verbosity(self.quiet_mode)
 
         # ---- Input validation (caller mistakes) -> DataValidationError / ConfigurationError
         if not isinstance(file_name, str) or not file_name.strip():
@@ -232,10 +492,45 @@ class VectorStore:
                 "meta_data must be a dict or None.", context={"meta_data_type": type(meta_data).__name__}
             )
 
+        # meta_data columns share the vectors table with the store's own columns, so they can't reuse their names
+        reserved_meta_columns = sorted(set(meta_data or {}).intersection(_RESERVED_COLUMNS))
+        if reserved_meta_columns:
+            raise DataValidationError(
+                "meta_data column names must not use names reserved by the VectorStore.",
+                context={"reserved_columns": reserved_meta_columns, "reserved_names": list(_RESERVED_COLUMNS)},
+            )
+
         # check that hooks is a dict if provided
         if hooks is not None and not isinstance(hooks, dict):
             raise DataValidationError("hooks must be a dict or None.", context={"hooks_type": type(hooks).__name__})
 
+        # check that the quantisation option is supported
+        if quantise not in [None, "int8"]:
+            raise DataValidationError(
+                "Unsupported quantise option. Choose from [None, 'int8'].",
+                context={"quantise": quantise},
+            )
+
+        # check that the similarity metric is supported
+        if metric not in ["dot", "cosine"]:
+            raise DataValidationError(
+                "Unsupported metric. Choose from ['dot', 'cosine'].",
+                context={"metric": metric},
+            )
+
+        # check that num_workers is a positive integer
+        if not isinstance(num_workers, int) or num_workers < 1:
+            raise DataValidationError("num_workers must be an integer >= 1.", context={"num_workers": num_workers})
+
+        # check that the index type is supported, and that the approximate index library is installed if requested
+        if index not in ["exact", "hnsw"]:
+            raise DataValidationError(
+                "Unsupported index option. Choose from ['exact', 'hnsw'].",
+                context={"index": index},
+            )
+        if index == "hnsw":
+            check_deps(["hnswlib"], extra="ann")
+
         # ---- Assign fields
         self.file_name = file_name
         self.data_type = data_type
@@ -249,9 +544,16 @@ class VectorStore:
         self.vectoriser_class = vectoriser.__class__.__name__
         self.hooks = {} if hooks is None else hooks
         self.skip_save = skip_save
+        self.quantise = quantise
+        self.metric = metric
+        self.index = index
+        self._ann_index = None
+        self._doc_matrix = None
+        self._doc_scales = None
+        self.num_workers = num_workers
 
         if self.output_dir is not None and self.skip_save:
-            logging.warning(
+            logger.warning(
                 "VectorStore creation: output_dir is set to %s but skip_save is True, so the VectorStore will not be saved to disk. output_dir will be ignored.",
                 self.output_dir,
             )
@@ -265,7 +567,7 @@ class VectorStore:
             # ---- Output directory handling (filesystem problems) -> ConfigurationError
             try:
                 if self.output_dir is None:
-                    logging.info(
+                    logger.info(
                         "No output directory specified, attempting to use input file name as output folder name."
                     )
                     normalized_file_name = os.path.basename(os.path.splitext(self.file_name)[0])
@@ -323,7 +625,7 @@ class VectorStore:
                     },
                 ) from e
         else:
-            logging.debug("skip_save is set to True, the VectorStore will not be saved to disk after creation.")
+            logger.debug("skip_save is set to True, the VectorStore will not be saved to disk after creation.")
 
         # ---- Build index (wrap every unexpected failure) -> IndexBuildError
         try:
@@ -346,19 +648,36 @@ class VectorStore:
         # ---- Save + derived metadata (IO/format problems) -> IndexBuildError
         self.vector_shape = self.vectors["embeddings"].to_numpy().shape[1]
         self.num_vectors = len(self.vectors)
+        self._cache_search_arrays()
+
+        # build any approximate index now, so the first search doesn't pay for it
+        try:
+            self._get_ann_index()
+        except Exception as e:
+            raise IndexBuildError(
+                "Failed to build HNSW index.",
+                context={"num_vectors": self.num_vectors, "cause_type": type(e).__name__, "cause_message": str(e)},
+            ) from e
 
         if not self.skip_save:
             try:
-                logging.info("Gathering metadata and saving vector store / metadata...")
+                logger.info("Gathering metadata and saving vector store / metadata...")
                 vectors_out_path = os.path.join(self.output_dir, "vectors.parquet")
+                # polars handles fsspec filesystems natively, so this will work with local and remote filesystems supported by fsspec
                 self.vectors.write_parquet(
-                    vectors_out_path
-                )  # polars handles fsspec filesystems natively, so this will work with local and remote filesystems supported by fsspec
+                    vectors_out_path,
+                    compression=_PARQUET_COMPRESSION,
+                    compression_level=_PARQUET_COMPRESSION_LEVEL,
+                )
+
+                # save the approximate index too, so reloaded stores don't rebuild it
+                if self._ann_index is not None:
+                    _save_hnsw_index(self._ann_index, os.path.join(self.output_dir, _HNSW_INDEX_FILE))
 
                 metadata_out_path = os.path.join(self.output_dir, "metadata.json")
                 self._save_metadata(metadata_out_path)
 
-                logging.info("Vector Store created - files saved to %s", self.output_dir)
+                logger.info("Vector Store created - files saved to %s", self.output_dir)
             except ClassifaiError:
                 raise
             except Exception as e:
@@ -367,7 +686,7 @@ class VectorStore:
                     context={"cause_type": type(e).__name__, "cause_message": str(e)},
                 ) from e
         else:
-            logging.debug("skip_save is True, skipping saving VectorStore to disk.")
+            logger.debug("skip_save is True, skipping saving VectorStore to disk.")
 
     def _save_metadata(self, path: str):
         """Saves metadata about the `VectorStore` to a JSON file.
@@ -400,6 +719,9 @@ class VectorStore:
                 "batch_size": self.batch_size,
                 "created_at": time.time(),
                 "meta_data": serializable_column_meta_data,
+                "quantise": self.quantise,
+                "metric": self.metric,
+                "index": self.index,
             }
 
             # inside separate function use fsspec again to write the metadata file to support different filesystems
@@ -423,8 +745,11 @@ class VectorStore:
         with polars, selecting the label, text, and any specified metadata
         columns. A UUID is assigned to each row and the text column is embedded
         in batches of self.batch_size using self.vectoriser.transform(). The
-        resulting embeddings are appended to self.vectors as an embeddings
-        column.
+        resulting embeddings are appended to self.vectors as a float32
+        embeddings column. If int8 quantisation is enabled, the embeddings column holds
+        the quantised values and an embeddings_scale column holds the per-row
+        scale factors. If the cosine metric is used, a norm column holds the L2
+        norm of each full precision embedding.
 
         Raises:
             DataValidationError: If the text column contains no documents, or
@@ -444,9 +769,7 @@ class VectorStore:
                     columns=["label", "text", *self.meta_data.keys()],
                     dtypes=self.meta_data | {"label": str, "text": str},
                 )
-                self.vectors = self.vectors.with_columns(
-                    pl.Series("uuid", [str(uuid.uuid4()) for _ in range(self.vectors.height)])
-                )
+                self.vectors = self.vectors.with_columns(_uuid4_series(self.vectors.height))
             else:
                 raise DataValidationError(
                     "File type not supported. Choose from ['csv'].",
@@ -460,52 +783,47 @@ class VectorStore:
                 context={"file_name": self.file_name, "data_type": self.data_type},
             ) from e
 
-        logging.info("Processing file: %s...\n", self.file_name)
+        logger.info("Processing file: %s...\n", self.file_name)
 
         # ---- Embedding / dataframe build (vectoriser failures and mismatches) -> IndexBuildError
         try:
-            documents = self.vectors["text"].to_list()
-            if not documents:
+            # batches are sliced from the text column and converted to Python strings one at a time, rather than
+            # converting the whole column to a list up front
+            documents = self.vectors["text"]
+            if documents.is_empty():
                 raise DataValidationError(
                     "Input file contains no documents in column 'text'.",
                     context={"file_name": self.file_name},
                 )
 
-            embeddings: list[np.ndarray] = []
-            for batch_id in self.classifai_tqdm(range(0, len(documents), self.batch_size)):
-                batch = documents[batch_id : (batch_id + self.batch_size)]
-                try:
-                    batch_embeddings = self.vectoriser.transform(batch)
-                except ClassifaiError:
-                    # preserve vectoriser classification, but add context by re-wrapping
-                    raise
-                except Exception as e:
-                    raise IndexBuildError(
-                        "Vectoriser.transform failed during index build.",
-                        context={
-                            "file_name": self.file_name,
-                            "vectoriser": self.vectoriser_class,
-                            "batch_id": batch_id,
-                            "batch_size": len(batch),
-                        },
-                    ) from e
-
-                # Basic sanity check: batch should return same number of vectors as texts
-                if len(batch_embeddings) != len(batch):
-                    raise IndexBuildError(
-                        "Vectoriser returned wrong number of embeddings for batch.",
-                        context={
-                            "file_name": self.file_name,
-                            "vectoriser": self.vectoriser_class,
-                            "batch_id": batch_id,
-                            "expected": len(batch),
-                            "got": len(batch_embeddings),
-                        },
-                    )
-
-                embeddings.extend(batch_embeddings)
-
-            self.vectors = self.vectors.with_columns(pl.Series(embeddings).alias("embeddings"))
+            # each batch is written straight into one preallocated float32 matrix, so the embeddings are never held
+            # twice (as a list of batches and a stacked copy), and polars wraps the matrix without copying it
+            batch_ids = range(0, len(documents), self.batch_size)
+            embed_batch = partial(self._embed_batch, documents)
+            embeddings = None
+            with ThreadPoolExecutor(max_workers=self.num_workers) as pool:
+                # vectorisers spend most of their time in network calls or native code that releases the GIL, so
+                # batches can be dispatched on threads; map keeps them in document order either way
+                batches = pool.map(embed_batch, batch_ids) if self.num_workers > 1 else map(embed_batch, batch_ids)
+                for batch_id, batch_embeddings in zip(
+                    batch_ids, self.classifai_tqdm(batches, total=len(batch_ids)), strict=True
+                ):
+                    if embeddings is None:
+                        embeddings = np.empty((len(documents), batch_embeddings.shape[1]), dtype=np.float32)
+                    embeddings[batch_id : batch_id + len(batch_embeddings)] = batch_embeddings
+
+            if self.metric == "cosine":
+                # norms are taken before any quantisation so they describe the original embeddings
+                norms = np.linalg.norm(embeddings, axis=1).astype(np.float32)
+                self.vectors = self.vectors.with_columns(pl.Series("norm", norms))
+            if self.quantise == "int8":
+                quantised, scales = _quantise_int8(embeddings)
+                self.vectors = self.vectors.with_columns(
+                    pl.Series("embeddings", quantised),
+                    pl.Series("embeddings_scale", scales),
+                )
+            else:
+                self.vectors = self.vectors.with_columns(pl.Series("embeddings", embeddings))
         except ClassifaiError:
             raise
         except Exception as e:
@@ -519,6 +837,112 @@ class VectorStore:
                 },
             ) from e
 
+    def _embed_batch(self, documents: pl.Series, batch_id: int) -> np.ndarray:
+        """Embeds one batch of documents with the vectoriser during index build.
+
+        Args:
+            documents (pl.Series): The text column of all documents being
+                indexed.
+            batch_id (int): The position of the first document in the batch.
+
+        Returns:
+            np.ndarray: A 2D float32 array holding one embedding per document
+                in the batch.
+
+        Raises:
+            ClassifaiError: If the vectoriser raises a package-specific error.
+            IndexBuildError: If the vectoriser fails, or returns the wrong
+                number of embeddings for the batch.
+        """
+        batch = documents.slice(batch_id, self.batch_size).to_list()
+        try:
+            batch_embeddings = self.vectoriser.transform(batch)
+        except ClassifaiError:
+            # preserve vectoriser classification, but add context by re-wrapping
+            raise
+        except Exception as e:
+            raise IndexBuildError(
+                "Vectoriser.transform failed during index build.",
+                context={
+                    "file_name": self.file_name,
+                    "vectoriser": self.vectoriser_class,
+                    "batch_id": batch_id,
+                    "batch_size": len(batch),
+                },
+            ) from e
+
+        # Basic sanity check: batch should return same number of vectors as texts
+        if len(batch_embeddings) != len(batch):
+            raise IndexBuildError(
+                "Vectoriser returned wrong number of embeddings for batch.",
+                context={
+                    "file_name": self.file_name,
+                    "vectoriser": self.vectoriser_class,
+                    "batch_id": batch_id,
+                    "expected": len(batch),
+                    "got": len(batch_embeddings),
+                },
+            )
+
+        # cast here, so batches queued by parallel workers are already at their stored precision
+        return np.asarray(batch_embeddings, dtype=np.float32)
+
+    def _cache_search_arrays(self):
+        """Caches the document arrays used by exact search, so `.search()` doesn't re-extract them per call.
+
+        For full precision stores the embeddings are cached as a contiguous
+        float32 matrix, which halves the memory read per query compared to
+        float64. For int8 quantised stores a read-only view of the quantised
+        column is cached with the per-row scale factors. For the cosine metric
+        the inverse document norms are cached as per-row factors too (folded
+        into the scales of int8 stores), and applied to the score matrix, so
+        no normalised copy of the embeddings is ever made.
+
+        This must be called again whenever `vectors` is replaced.
+        """
+        if self.metric == "cosine":
+            doc_norms = self.vectors["norm"].to_numpy()
+            # zero vectors keep a score of zero rather than dividing by zero
+            doc_inv_norms = (1.0 / np.where(doc_norms == 0, 1.0, doc_norms)).astype(np.float32)
+        else:
+            doc_inv_norms = None
+
+        if self.quantise == "int8":
+            self._doc_matrix = self.vectors["embeddings"].to_numpy(writable=False)
+            doc_scales = self.vectors["embeddings_scale"].to_numpy()
+            self._doc_scales = doc_scales * doc_inv_norms if doc_inv_norms is not None else doc_scales
+        else:
+            # zero-copy when the column is already float32
+            self._doc_matrix = np.ascontiguousarray(
+                self.vectors["embeddings"].to_numpy(writable=False), dtype=np.float32
+            )
+            self._doc_scales = doc_inv_norms
+
+    def _get_ann_index(self):
+        """Returns the HNSW index used for approximate search, building it on first use.
+
+        The index is built over the full precision embeddings (dequantising
+        them first if the store is int8 quantised, and normalising them for
+        the cosine metric) and cached on the instance.
+
+        Returns:
+            hnswlib.Index | None: The approximate index, or None if the store
+                uses the exact index type or holds fewer vectors than the
+                approximate search threshold.
+        """
+        if self.index != "hnsw" or self.num_vectors < _ANN_MIN_VECTORS:
+            return None
+
+        if self._ann_index is None:
+            logger.info("Building HNSW index over %d vectors...", self.num_vectors)
+            doc_matrix = self._doc_matrix
+            if self._doc_scales is not None:
+                # the index holds its own copy of the vectors, so the scaled matrix is only needed while building
+                doc_matrix = np.asarray(doc_matrix, dtype=np.float32) * self._doc_scales[:, None]
+            self._ann_index = _build_hnsw_index(doc_matrix)
+
+        return self._ann_index
+
     def embed(self, query: VectorStoreEmbedInput) -> VectorStoreEmbedOutput:  # noqa: C901
         """Generates vector embeddings from a `VectorStoreEmbedInput` object.
 
@@ -758,8 +1182,14 @@ class VectorStore:
         Queries are processed in batches of batch_size, with each batch
         embedded using vectoriser.transform() and scored against all stored
         document embeddings via dot-product similarity (equivalent to cosine
-        similarity when embeddings are L2-normalised). The top n_results
-        documents are returned for each query, ordered by descending score.
+        similarity when embeddings are L2-normalised). If the store was built
+        with the cosine metric, scores are divided by the query and saved
+        document norms. If the store was built with the "hnsw" index type and
+        holds enough vectors, the approximate index is queried instead of
+        scoring every document. When the store holds
+        int8 quantised embeddings, scores are computed against the dequantised
+        documents. The top n_results documents are returned for each query,
+        ordered by descending score.
 
         Any preprocessing hooks set on the instance are applied to the input
         before searching, and any postprocessing hooks are applied to the
@@ -769,7 +1199,8 @@ class VectorStore:
             query (VectorStoreSearchInput): The input object containing the
                 text query or list of queries to search for, with ids.
             n_results (int): Number of top results to return for each query.
-                Defaults to 10.
+                If it exceeds the number of vectors in the store, every
+                document is returned for each query. Defaults to 10.
             batch_size (int): The batch size for processing queries. Defaults
                 to the batch_size set during initialisation.
 
@@ -807,6 +1238,9 @@ class VectorStore:
         if len(query) == 0:
             raise DataValidationError("query is empty.", context={"n_queries": 0})
 
+        # a query can't have more results than there are documents
+        n_results = min(n_results, self.num_vectors)
+
         # ---- Preprocess hook -> DataValidationError if it returns invalid shape/type
         if "search_preprocess" in self.hooks:
             try:
@@ -823,13 +1257,38 @@ class VectorStore:
 
         # ---- Main search (wrap operational failures) -> SearchError / VectorisationError
         try:
-            doc_embeddings = self.vectors["embeddings"].to_numpy()
+            doc_embeddings, doc_scales = self._doc_matrix, self._doc_scales
+            ann_index = self._get_ann_index()
+            if ann_index is not None:
+                # ef must be at least the number of neighbours requested
+                ann_index.set_ef(max(_HNSW_EF_SEARCH, n_results))
 
             all_results: list[pl.DataFrame] = []
 
+            # ranks are the same 1..n_results run for every query, so build them once as int32
+            rank_row = np.arange(1, n_results + 1, dtype=np.int32)
+
+            # convert the query columns once, then slice per batch instead of re-listing them every batch
+            query_texts = pl.Series(query.query.to_list(), dtype=pl.Utf8)
+            query_ids = pl.Series(query.id.astype(str).to_list(), dtype=pl.Utf8)
+
+            # the document columns to fetch, and the renames, casts and order of the output columns, are the same
+            # for every batch, so build them once and apply each in a single select
+            doc_columns = ["label", "text", *self.meta_data.keys()]
+            output_columns = [
+                pl.col("query_id"),
+                pl.col("query_text"),
+                pl.col("label").cast(pl.Utf8).alias("doc_label"),
+                pl.col("text").cast(pl.Utf8).alias("doc_text"),
+                pl.col("rank").cast(pl.Int64),
+                pl.col("score").cast(pl.Float64),
+                *[pl.col(column) for column in self.meta_data],
+            ]
+
             for i in self.classifai_tqdm(range(0, len(query), query_batch_size), desc="Processing query batches"):
-                query_text_batch = query.query.to_list()[i : i + query_batch_size]
-                query_ids_batch = query.id.to_list()[i : i + query_batch_size]
+                query_text_series = query_texts.slice(i, query_batch_size)
+                query_text_batch = query_text_series.to_list()
+                query_ids_series = query_ids.slice(i, query_batch_size)
 
                 if len(query_text_batch) == 0:
                     continue
@@ -850,47 +1309,42 @@ class VectorStore:
                         },
                     ) from e
 
-                # Similarity + top-k
-                cosine = query_vectors @ doc_embeddings.T
-
-                idx = np.argpartition(cosine, -n_results, axis=1)[:, -n_results:]
+                # float32 to match the cached document matrix, so the product stays a float32 GEMM
+                query_vectors = np.asarray(query_vectors, dtype=np.float32)
 
-                idx_sorted = np.zeros_like(idx)
-                scores = np.zeros_like(idx, dtype=float)
+                if self.metric == "cosine":
+                    # normalise the (small) query block before scoring rather than dividing the full score matrix,
+                    # with einsum summing the squares without a temporary; zero vectors are left as they are
+                    query_norms = np.sqrt(np.einsum("ij,ij->i", query_vectors, query_vectors))
+                    query_vectors = query_vectors / np.where(query_norms == 0, 1.0, query_norms)[:, None]
 
-                for j in range(idx.shape[0]):
-                    row_scores = cosine[j, idx[j]]
-                    sorted_indices = np.argsort(row_scores)[::-1]
-                    idx_sorted[j] = idx[j, sorted_indices]
-                    scores[j] = row_scores[sorted_indices]
-
-                # Build batch result table
+                # Similarity + top-k
+                if ann_index is not None:
+                    # hnswlib returns the nearest neighbours first, with a distance of 1 - similarity
+                    labels, distances = ann_index.knn_query(query_vectors, k=n_results)
+                    idx_sorted = labels.astype(np.int64)
+                    scores = 1.0 - distances.astype(float)
+                else:
+                    # the whole batch is scored in one call: the matmul is already multithreaded by BLAS, and int8
+                    # documents are dequantised once per document tile rather than once per query tile
+                    idx_sorted, scores = _exact_top_k(query_vectors, doc_embeddings, n_results, doc_scales)
+
+                # Build batch result table - query ids and texts are repeated by gathering their positions from
+                # string columns, rather than broadcasting Python strings into NumPy object arrays
+                query_positions = np.repeat(np.arange(len(query_text_batch)), n_results)
                 result_df = pl.DataFrame(
                     {
-                        "query_id": np.repeat(query_ids_batch, n_results),
-                        "query_text": np.repeat(query_text_batch, n_results),
-                        "rank": np.tile(np.arange(1, n_results + 1), len(query_text_batch)),
+                        "query_id": query_ids_series.gather(query_positions),
+                        "query_text": query_text_series.gather(query_positions),
+                        "rank": np.broadcast_to(rank_row, (len(query_text_batch), n_results)).ravel(),
                         "score": scores.flatten(),
                     }
                 )
 
-                ranked_docs = self.vectors[idx_sorted.flatten().tolist()].select(
-                    ["label", "text", *self.meta_data.keys()]
-                )
-                merged_df = result_df.hstack(ranked_docs).rename({"label": "doc_label", "text": "doc_text"})
-
-                merged_df = merged_df.with_columns(
-                    [
-                        pl.col("doc_label").cast(str),
-                        pl.col("doc_text").cast(str),
-                        pl.col("rank").cast(int),
-                        pl.col("score").cast(float),
-                        pl.col("query_id").cast(str),
-                        pl.col("query_text").cast(str),
-                    ]
-                )
-
-                all_results.append(merged_df)
+                # select before gathering so the embeddings column is never copied, and pass the
+                # indices as an array rather than round-tripping them through a Python list
+                ranked_docs = self.vectors.select(doc_columns).gather(idx_sorted.ravel())
+                all_results.append(result_df.hstack(ranked_docs).select(output_columns))
 
             if not all_results:
                 # Shouldn't happen if len(query)>0, but keep it safe.
@@ -907,11 +1361,7 @@ class VectorStore:
                 )
                 return VectorStoreSearchOutput.from_data(empty.to_dict(as_series=False))
 
-            reordered_df = pl.concat(all_results).select(
-                ["query_id", "query_text", "doc_label", "doc_text", "rank", "score", *self.meta_data.keys()]
-            )
-
-            result_df = VectorStoreSearchOutput.from_data(reordered_df.to_dict(as_series=False))
+            result_df = VectorStoreSearchOutput.from_data(pl.concat(all_results).to_dict(as_series=False))
 
         except ClassifaiError:
             raise
@@ -997,13 +1447,15 @@ class VectorStore:
                 is missing or malformed, or if vectors.parquet is missing,
                 empty, or does not contain the required columns.
             OptionalDependencyError: If the user attempts to use a gs:// path
-                without having gcsfs installed.
+                without having gcsfs installed, or loads a store saved with an
+                "hnsw" index without having hnswlib installed.
             ConfigurationError: If vectoriser does not have a callable
                 .transform() method, if the fsspec path cannot be resolved,
                 or if the vectoriser class name does not match the one stored in
                 metadata.json.
-            IndexBuildError: If metadata.json or vectors.parquet cannot
-                be read or parsed, or if the instance cannot be constructed.
+            IndexBuildError: If metadata.json, vectors.parquet, or a saved
+                HNSW index cannot be read or parsed, or if the instance cannot
+                be constructed.
         """
         # ---- Validate arguments (caller mistakes) -> DataValidationError / ConfigurationError
         if not isinstance(folder_path, str) or not folder_path.strip():
@@ -1108,12 +1560,12 @@ class VectorStore:
 
         if metadata.get("batch_size") is None:
             if batch_size is not None:
-                logging.warning(
+                logger.warning(
                     "Metadata is outdated (pre v1.1.0) and does not contain a batch_size. Using provided batch_size=%d.",
                     batch_size,
                 )
             else:
-                logging.warning(
+                logger.warning(
                     "Metadata is outdated (pre v1.1.0) and does not contain a batch_size. Defaulting to %d.",
                     _BATCH_SIZE,
                 )
@@ -1126,7 +1578,48 @@ class VectorStore:
                 context={"folder_path": folder_path, "vectors_path": vectors_in_path},
             )
 
+        # stores created before quantisation was supported hold full precision embeddings
+        quantise = metadata.get("quantise")
+        if quantise not in [None, "int8"]:
+            raise DataValidationError(
+                "Unsupported quantise option in metadata.",
+                context={"metadata_path": metadata_in_path, "quantise": quantise},
+            )
+
+        # stores created before the metric option was added were always searched by dot product
+        metric = metadata.get("metric", "dot")
+        if metric not in ["dot", "cosine"]:
+            raise DataValidationError(
+                "Unsupported metric in metadata.",
+                context={"metadata_path": metadata_in_path, "metric": metric},
+            )
+
+        # stores created before the index option was added were always searched exactly
+        index = metadata.get("index", "exact")
+        if index not in ["exact", "hnsw"]:
+            raise DataValidationError(
+                "Unsupported index option in metadata.",
+                context={"metadata_path": metadata_in_path, "index": index},
+            )
+        if index == "hnsw":
+            check_deps(["hnswlib"], extra="ann")
+
+        # ---- Validate vectoriser class match -> ConfigurationError (before reading the vectors, so a mismatch fails fast)
+        if metadata["vectoriser_class"] != vectoriser.__class__.__name__:
+            raise ConfigurationError(
+                "Vectoriser class in metadata does not match provided vectoriser.",
+                context={
+                    "metadata_vectoriser_class": metadata["vectoriser_class"],
+                    "provided_vectoriser_class": vectoriser.__class__.__name__,
+                },
+            )
+
+        # only the columns the store uses are read from the parquet file
         required_columns = ["label", "text", "embeddings", "uuid", *deserialized_column_meta_data.keys()]
+        if quantise == "int8":
+            required_columns.append("embeddings_scale")
+        if metric == "cosine":
+            required_columns.append("norm")
 
         try:
             df = pl.read_parquet(vectors_in_path, columns=required_columns)  # polars handles fsspec path natively
@@ -1153,14 +1646,28 @@ class VectorStore:
                 context={"vectors_path": vectors_in_path, "missing_columns": missing_cols},
             )
 
-        # ---- Validate vectoriser class match -> ConfigurationError
-        if metadata["vectoriser_class"] != vectoriser.__class__.__name__:
-            raise ConfigurationError(
-                "Vectoriser class in metadata does not match provided vectoriser.",
-                context={
-                    "metadata_vectoriser_class": metadata["vectoriser_class"],
-                    "provided_vectoriser_class": vectoriser.__class__.__name__,
-                },
+        # embeddings must be a fixed-size Array column so that .to_numpy() returns a 2D array without copying
+        # through an object array; stores written as variable-length lists are converted once here
+        embeddings_dtype = df.schema["embeddings"]
+        if isinstance(embeddings_dtype, pl.List):
+            try:
+                df = df.with_columns(
+                    pl.col("embeddings").cast(pl.Array(embeddings_dtype.inner, metadata["vector_shape"]))
+                )
+            except Exception as e:
+                raise DataValidationError(
+                    "Vectors Parquet embeddings could not be converted to fixed-size arrays.",
+                    context={
+                        "vectors_path": vectors_in_path,
+                        "vector_shape": metadata["vector_shape"],
+                        "cause_type": type(e).__name__,
+                        "cause_message": str(e),
+                    },
+                ) from e
+        elif not isinstance(embeddings_dtype, pl.Array):
+            raise DataValidationError(
+                "Vectors Parquet embeddings column must hold numeric arrays.",
+                context={"vectors_path": vectors_in_path, "embeddings_dtype": str(embeddings_dtype)},
             )
 
         # ---- Construct instance without __init__ and assign fields
@@ -1176,16 +1683,17 @@ class VectorStore:
             vector_store.num_vectors = metadata["num_vectors"]
             vector_store.vectoriser_class = metadata["vectoriser_class"]
             vector_store.hooks = {} if hooks is None else hooks
+            vector_store.quantise = quantise
+            vector_store.metric = metric
+            vector_store.index = index
+            vector_store._ann_index = None
+            vector_store._cache_search_arrays()
             vector_store.quiet_mode = quiet_mode
             if vector_store.quiet_mode:
                 vector_store.classifai_tqdm = lambda iterable, *args, **kwargs: iterable
-                logging.basicConfig(level=logging.WARNING, format="%(levelname)s - %(message)s", force=True)
             else:
                 vector_store.classifai_tqdm = tqdm
-                logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s", force=True)
-            logging.getLogger("httpcore").setLevel(logging.WARNING)
-            logging.getLogger("httpx").setLevel(logging.WARNING)
-            logging.getLogger("urllib3.connectionpool").setLevel(logging.WARNING)
+            _set_log_verbosity(vector_store.quiet_mode)
 
         except Exception as e:
             raise IndexBuildError(
@@ -1199,4 +1707,18 @@ class VectorStore:
                 },
             ) from e
 
+        # ---- Load the saved approximate index, or build it if none was saved -> IndexBuildError
+        ann_in_path = os.path.join(folder_path, _HNSW_INDEX_FILE)
+        if index == "hnsw":
+            try:
+                if in_fs.exists(ann_in_path):
+                    vector_store._ann_index = _load_hnsw_index(ann_in_path, vector_store.vector_shape)
+                else:
+                    vector_store._get_ann_index()
+            except Exception as e:
+                raise IndexBuildError(
+                    "Failed to load or build HNSW index.",
+                    context={"index_path": ann_in_path, "cause_type": type(e).__name__, "cause_message": str(e)},
+                ) from e
+
         return vector_store
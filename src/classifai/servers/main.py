@@ -165,6 +165,11 @@ def run_server(  # noqa: PLR0913
 ) -> None:
     """Create and run a FastAPI server with search endpoints.
 
+    The server runs as a single process, so each VectorStore is held in
+    memory once. The endpoints are plain functions, which FastAPI runs on its
+    worker threadpool, so a slow embedding or search request doesn't block
+    the event loop for other requests.
+
     Args:
         vector_stores (list[VectorStore]): A list of VectorStore objects, each
             responsible for handling embedding and search operations for a
@@ -251,7 +256,7 @@ def _create_embedding_endpoint(router: APIRouter | FastAPI, endpoint_name: str,
         summary=f"{endpoint_name} Embedding Endpoint",
         description=f"Endpoint to call the `{endpoint_name}` `VectorStore.embed` method",
     )
-    async def embedding_endpoint(data: EmbedRequestSet) -> EmbedResponseBody:
+    def embedding_endpoint(data: EmbedRequestSet) -> EmbedResponseBody:
         input_ids = [x.id for x in data.entries]
         input_texts = [x.text for x in data.entries]
 
@@ -283,7 +288,7 @@ def _create_search_endpoint(router: APIRouter | FastAPI, endpoint_name: str, vec
         summary=f"{endpoint_name} Search Endpoint",
         description=f"Endpoint to call the `{endpoint_name}` `VectorStore.search` method",
     )
-    async def search_endpoint(
+    def search_endpoint(
         data: SearchRequestSet,
         n_results: Annotated[
             int,
@@ -167,7 +167,8 @@ def convert_reverse_search_dataframe_to_pydantic_response(
 
     Args:
         df (pd.DataFrame): Pandas DataFrame containing reverse search results.
-        meta_data (dict): dictionary of metadata column names mapping to their types.
+        meta_data (dict): dictionary of metadata column names mapping to their types. Metadata columns are
+            returned with each entry alongside any columns added by hooks.
         original_input (list[dict]): The original input data for the reverse search.
             This is included as an argument to ensure there is a reference to each input in the API response, even
             if no matches are found.
@@ -175,73 +176,35 @@ def convert_reverse_search_dataframe_to_pydantic_response(
     Returns:
         ReverseSearchResponseBody: Pydantic model containing the API structured result for reverse search `VectorStore` method.
     """
-    # identify metadata columns from the DataFrame by checking which columns are in the meta_data dictionary
-    hook_columns = (
-        set(df.columns)
-        .difference(meta_data.keys())
-        .difference(
-            {
-                "id",
-                "searched_doc_label",
-                "doc_label",
-                "doc_text",
-            }
-        )
-    )
-    results_list = []
-
-    for original_query in original_input:
-        input_id = original_query["id"]
-        input_doc_label = original_query["doc_label"]
-        # Get the subset of the DataFrame corresponding to the current `id`
-        group_df = df[df["id"] == input_id]
-
-        if group_df.empty:
-            # If there are no matches for this input_id, we still want to include it in the response, with empty results
-            results_list.append(
-                ReverseSearchResponseSet(
-                    input_id=input_id,
-                    searched_doc_label=input_doc_label,
-                    entries=[],
-                )
-            )
-            continue
-
-        # Convert group_df to a list of dictionaries
-        rows_as_dicts = group_df.to_dict(orient="records")
-
-        # Build the list of ReverseSearchResponseEntry objects for the current group
-        response_entries = []
-        for row in rows_as_dicts:
-            # Extract metadata columns dynamically
-            metadata_values = {meta: row[meta] for meta in meta_data if meta in row}
-
-            # Find other values - added by hooks - any other per-row columns not in reserved/meta
-            other_values = {k: v for k, v in row.items() if k in hook_columns}
-
-            # Create a ReverseSearchResponseEntry object
-            response_entries.append(
-                ReverseSearchResponseEntry(
-                    doc_label=row["doc_label"],
-                    doc_text=row["doc_text"],
-                    **metadata_values,  # Add metadata dynamically
-                    **other_values,  # Add any extra columns dynamically
-                )
-            )
-
-        # Create a ReverseSearchResponseSet object for the current `id` and 'doc_label'
-        results_list.append(
-            ReverseSearchResponseSet(
-                input_id=input_id,
-                searched_doc_label=group_df["searched_doc_label"].iloc[
-                    0
-                ],  # Assuming `doc_label` is the same for all rows in the group
-                entries=response_entries,
-            )
-        )
-
-    # Create the ReverseSearchResponseBody object to be returned
-    response_body = ReverseSearchResponseBody(data=results_list)
+    # every column other than the input id and searched label (i.e. doc_label, doc_text, metadata and any columns
+    # added by hooks) belongs to the result entries
+    entry_columns = [col for col in df.columns if col not in {"id", "searched_doc_label"}]
+
+    # the rows are converted in one pass and grouped by input id, rather than filtering the DataFrame once per input;
+    # the searched label is taken from the first row of each group, as hooks may have changed it
+    entries_by_id = {}
+    searched_labels_by_id = {}
+    for input_id, searched_label, entry in zip(
+        df["id"].tolist(),
+        df["searched_doc_label"].tolist(),
+        df[entry_columns].to_dict(orient="records"),
+        strict=True,
+    ):
+        entries_by_id.setdefault(input_id, []).append(entry)
+        searched_labels_by_id.setdefault(input_id, searched_label)
+
+    # inputs with no matches are still included in the response, with empty results and their original label
+    results_list = [
+        {
+            "input_id": original_query["id"],
+            "searched_doc_label": searched_labels_by_id.get(original_query["id"], original_query["doc_label"]),
+            "entries": entries_by_id.get(original_query["id"], []),
+        }
+        for original_query in original_input
+    ]
+
+    # the whole response is validated in one call, instead of constructing each entry model separately
+    response_body = ReverseSearchResponseBody.model_validate({"data": results_list})
 
     return response_body
 
@@ -251,67 +214,31 @@ def convert_search_dataframe_to_pydantic_response(df: pd.DataFrame, meta_data: d
 
     Args:
         df (pd.DataFrame): Pandas DataFrame containing search results.
-        meta_data (dict): dictionary of metadata column names mapping to their types.
+        meta_data (dict): dictionary of metadata column names mapping to their types. Metadata columns are
+            returned with each entry alongside any columns added by hooks.
 
     Returns:
         SearchResponseBody: Pydantic model containing the API structured results for search `VectorStore` method.
     """
-    # identify metadata columns from the DataFrame by checking which columns are in the meta_data dictionary
-    hook_columns = (
-        set(df.columns)
-        .difference(meta_data.keys())
-        .difference(
-            {
-                "query_id",
-                "query_text",
-                "doc_label",
-                "doc_text",
-                "score",
-                "rank",
-            }
-        )
-    )
-
-    # Group rows by `query_id`
-    grouped = df.groupby("query_id")
-
-    results_list = []
-    for query_id, group_df in grouped:
-        # Convert group_df to a list of dictionaries
-        rows_as_dicts = group_df.to_dict(orient="records")
-
-        # Build the list of SearchResponseEntry objects for the current group
-        response_entries = []
-        for row in rows_as_dicts:
-            # Extract metadata columns dynamically
-            metadata_values = {meta: row[meta] for meta in meta_data}
-
-            # Find other values - added by hooks - any other per-row columns not in reserved/meta
-            other_values = {k: v for k, v in row.items() if k in hook_columns}
-
-            # Create a SearchResponseEntry object
-            response_entries.append(
-                SearchResponseEntry(
-                    doc_label=row["doc_label"],
-                    doc_text=row["doc_text"],
-                    rank=row["rank"],  # Assuming `rank` is a column in the DataFrame
-                    score=row["score"],  # Assuming `score` is a column in the DataFrame
-                    **metadata_values,  # Add metadata dynamically
-                    **other_values,  # Add any extra columns dynamically
-                )
-            )
-
-        # Create a SearchResponseSet object for the current 'query_id' and 'query_text'
-        results_list.append(
-            SearchResponseSet(
-                query_id=query_id,
-                query_text=group_df["query_text"].iloc[0],
-                entries=response_entries,
-            )
-        )
-
-    # Create the SearchResponseBody object to be returned
-    response_body = SearchResponseBody(data=results_list)
+    # every column other than the query id and text (i.e. doc_label, doc_text, rank, score, metadata and any columns
+    # added by hooks) belongs to the result entries
+    entry_columns = [col for col in df.columns if col not in {"query_id", "query_text"}]
+
+    # the rows are converted in one pass and grouped by query id, rather than building a DataFrame per query
+    results_by_id = {}
+    for query_id, query_text, entry in zip(
+        df["query_id"].tolist(),
+        df["query_text"].tolist(),
+        df[entry_columns].to_dict(orient="records"),
+        strict=True,
+    ):
+        if query_id not in results_by_id:
+            results_by_id[query_id] = {"query_id": query_id, "query_text": query_text, "entries": []}
+        results_by_id[query_id]["entries"].append(entry)
+
+    # queries are ordered by id, and the whole response is validated in one call, instead of constructing each entry
+    # model separately
+    response_body = SearchResponseBody.model_validate({"data": [results_by_id[key] for key in sorted(results_by_id)]})
 
     return response_body
 
@@ -330,29 +257,11 @@ def convert_embedding_dataframe_to_pydantic_response(df: pd.DataFrame) -> EmbedR
     Returns:
         EmbedResponseBody: Pydantic model containing the API structured results for embed `VectorStore` method.
     """
-    # identify hook columns from the DataFrame by checking which columns are in the required columns
-    hook_columns = set(df.columns).difference(
-        {
-            "id",
-            "text",
-            "embedding",
-        }
-    )
+    # the rows are converted in one pass, with each embedding turned into a list for JSON serialisation
+    response_entries = df.to_dict(orient="records")
+    for entry in response_entries:
+        entry["embedding"] = entry["embedding"].tolist()
 
-    # Build the list of EmbedResponseEntry objects for the current group
-    response_entries = []
-    for _, row in df.iterrows():
-        other_values = {k: v for k, v in row.items() if k in hook_columns}
-
-        # Create an EmbedResponseEntry object
-        response_entries.append(
-            EmbedResponseEntry(
-                id=row["id"],
-                text=row["text"],
-                embedding=row["embedding"].tolist(),  # Convert numpy array to list for JSON serialization
-                **other_values,  # Add any extra columns dynamically
-            )
-        )
-    # Create the EmbedResponseBody object to be returned
-    response_body = EmbedResponseBody(data=response_entries)
+    # the whole response is validated in one call, instead of constructing each entry model separately
+    response_body = EmbedResponseBody.model_validate({"data": response_entries})
     return response_body
@@ -46,10 +46,16 @@ These classes abstract the underlying implementation details, providing a simple
 interface for embedding text using different services.
 """
 
+import hashlib
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
 
 import numpy as np
 
+from classifai.exceptions import DataValidationError
+
 ##
 # The following is the abstract base class for all vectorisers.
 ##
@@ -81,3 +87,125 @@ class VectoriserBase(ABC):
             text.
         """
         pass
+
+
+def _coerce_texts(texts: str | Iterable[str]) -> list[str]:
+    """Normalises the texts passed to a ready-made vectoriser's transform into a list.
+
+    Args:
+        texts (str | Iterable[str]): A single text, or any iterable of texts,
+            e.g. a list, tuple, NumPy array or pandas Series.
+
+    Returns:
+        list[str]: The texts as a list of strings.
+
+    Raises:
+        DataValidationError: If texts is not a string or an iterable of
+            strings.
+    """
+    if isinstance(texts, str):
+        return [texts]
+    if not isinstance(texts, list):
+        try:
+            texts = list(texts)
+        except TypeError as e:
+            raise DataValidationError(
+                "texts must be a string or an iterable of strings.",
+                context={"texts_type": type(texts).__name__},
+            ) from e
+    if not all(isinstance(text, str) for text in texts):
+        bad_text = next(text for text in texts if not isinstance(text, str))
+        raise DataValidationError(
+            "texts must be a string or an iterable of strings.",
+            context={"text_type": type(bad_text).__name__},
+        )
+    return texts
+
+
+def _embed_unique(texts: list[str], embed: Callable[[list[str]], np.ndarray]) -> np.ndarray:
+    """Embeds each distinct text once, repeating its embedding for every duplicate.
+
+    Args:
+        texts (list[str]): The texts to embed, possibly with duplicates.
+        embed (Callable[[list[str]], np.ndarray]): The vectoriser's embedding
+            function, called once with the distinct texts in order of first
+            appearance.
+
+    Returns:
+        numpy.ndarray: A 2D array of embeddings, where each row corresponds to
+            an input text.
+    """
+    # a dict keeps first-appearance order and avoids sorting the strings, as np.unique would
+    first_positions: dict[str, int] = {}
+    inverse = [first_positions.setdefault(text, len(first_positions)) for text in texts]
+    if len(first_positions) == len(texts):
+        return embed(texts)
+    return embed(list(first_positions))[np.asarray(inverse)]
+
+
+class _EmbeddingCache:
+    """A least-recently-used, in-memory cache of text embeddings for the ready-made vectorisers.
+
+    Texts are keyed by a 16-byte BLAKE2b digest rather than stored in full,
+    so long texts cost no more to cache than short ones.
+
+    Attributes:
+        max_entries (int): The maximum number of embeddings held; the least
+            recently used are dropped beyond this.
+    """
+
+    def __init__(self, max_entries: int):
+        """Initialises an empty cache holding at most max_entries embeddings.
+
+        Args:
+            max_entries (int): The maximum number of embeddings to hold.
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def transform(self, texts: list[str], embed: Callable[[list[str]], np.ndarray]) -> np.ndarray:
+        """Embeds texts, only passing those not already cached to embed.
+
+        Args:
+            texts (list[str]): The texts to embed.
+            embed (Callable[[list[str]], np.ndarray]): The vectoriser's
+                uncached embedding function, called once with every text
+                missing from the cache.
+
+        Returns:
+            numpy.ndarray: A 2D float32 array of embeddings, where each row
+                corresponds to an input text.
+        """
+        if len(texts) == 0:
+            return embed(texts)
+
+        keys = [hashlib.blake2b(text.encode(), digest_size=16).digest() for text in texts]
+
+        rows: dict[bytes, np.ndarray] = {}
+        missing: dict[bytes, str] = {}
+        with self._lock:
+            for key, text in zip(keys, texts, strict=True):
+                if key in rows or key in missing:
+                    continue
+                row = self._entries.get(key)
+                if row is None:
+                    missing[key] = text
+                else:
+                    self._entries.move_to_end(key)
+                    rows[key] = row
+
+        # embed outside the lock, so other threads can still read cached texts during a slow request
+        if missing:
+            embeddings = np.asarray(embed(list(missing.values())), dtype=np.float32)
+            with self._lock:
+                # copy each row, so a cached row doesn't keep the whole embedding array of its request alive
+                for key, row in zip(missing, embeddings, strict=True):
+                    rows[key] = self._entries[key] = row.copy()
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        result = np.empty((len(texts), len(next(iter(rows.values())))), dtype=np.float32)
+        for i, key in enumerate(keys):
+            result[i] = rows[key]
+        return result
@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
+from classifai._genai import get_genai_client
 from classifai._optional import check_deps
 from classifai.exceptions import ConfigurationError, ExternalServiceError, VectorisationError
 
-from .base import VectoriserBase
+from .base import VectoriserBase, _coerce_texts, _embed_unique, _EmbeddingCache
 
 logging.getLogger("google.auth").setLevel(logging.WARNING)
 logging.getLogger("google.cloud").setLevel(logging.WARNING)
@@ -17,6 +19,15 @@ logging.getLogger("google.api_core").setLevel(logging.WARNING)
 
 logger = logging.getLogger(__name__)
 
+# the GenAI embedding endpoint caps the number of texts accepted in one request
+_MAX_TEXTS_PER_REQUEST = 250
+# rate-limited (429) and transiently failing requests are retried with exponential backoff, rather than failing the
+# whole transform; attempts include the first request, and delays are in seconds
+_RETRY_ATTEMPTS = 5
+_RETRY_INITIAL_DELAY = 0.5
+_RETRY_MAX_DELAY = 8.0
+_RETRY_STATUS_CODES = [408, 429, 500, 502, 503, 504]
+
 
 class GcpVectoriser(VectoriserBase):
     """A class for embedding text using Google Cloud Platform's GenAI API.
@@ -41,15 +52,22 @@ class GcpVectoriser(VectoriserBase):
             text.
         model_config (genai.types.EmbedContentConfig): Configuration for the
             embedding task.
+        max_concurrency (int): The maximum number of embedding requests sent
+            to the GenAI API at once.
+        cache_size (int): The maximum number of text embeddings kept in
+            memory, or 0 if embeddings are not cached.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         project_id=None,
         api_key=None,
         location="europe-west2",
         model_name="text-embedding-004",
         task_type="CLASSIFICATION",
+        *,
+        max_concurrency=8,
+        cache_size=0,
         **client_kwargs,
     ):
         """Initialises the GcpVectoriser with the specified project ID, location, and model name.
@@ -67,10 +85,18 @@ class GcpVectoriser(VectoriserBase):
                 "CLASSIFICATION". See
                 https://cloud.google.com/vertex-ai/generative-ai/docs/embeddings/task-types
                 for other options.
+            max_concurrency (int): [optional] The maximum number of embedding
+                requests sent to the GenAI API at once, when the texts passed
+                to `transform` are split over several requests. Defaults to 8.
+            cache_size (int): [optional] The maximum number of text embeddings
+                to keep in memory, so repeated texts are not embedded again.
+                Defaults to 0, which disables the cache.
             **client_kwargs: [optional] Additional keyword arguments to pass to
                 the GenAI client. To invoke via the Agent Platform API
                 (formerly VertexAI) API rather than the GenAI API, pass the
-                additional kwarg `vertexai=True`.
+                additional kwarg `vertexai=True`. Unless `http_options` is
+                passed here, requests that are rate limited or fail
+                transiently are retried up to 4 times with exponential backoff.
 
         Raises:
             `ConfigurationError`: If the authentication arguments are invalid,
@@ -79,8 +105,23 @@ class GcpVectoriser(VectoriserBase):
         check_deps(["google-genai"], extra="gcp")
         from google import genai  # type: ignore
 
+        if not isinstance(max_concurrency, int) or max_concurrency < 1:
+            raise ConfigurationError(
+                "max_concurrency must be an integer >= 1.",
+                context={"vectoriser": "gcp", "max_concurrency": max_concurrency},
+            )
+
+        if not isinstance(cache_size, int) or cache_size < 0:
+            raise ConfigurationError(
+                "cache_size must be an integer >= 0.",
+                context={"vectoriser": "gcp", "cache_size": cache_size},
+            )
+        self.cache_size = cache_size
+        self._embedding_cache = _EmbeddingCache(cache_size) if cache_size > 0 else None
+
         self.model_name = model_name
         self.model_config = genai.types.EmbedContentConfig(task_type=task_type)
+        self.max_concurrency = max_concurrency
 
         if project_id and not api_key:
             client_kwargs.setdefault("project", project_id)
@@ -93,36 +134,44 @@ class GcpVectoriser(VectoriserBase):
                 context={"vectoriser": "gcp"},
             )
 
+        # retry rate-limited and transiently failing requests, unless the caller configures HTTP options themselves
+        client_kwargs.setdefault(
+            "http_options",
+            genai.types.HttpOptions(
+                retry_options=genai.types.HttpRetryOptions(
+                    attempts=_RETRY_ATTEMPTS,
+                    initial_delay=_RETRY_INITIAL_DELAY,
+                    max_delay=_RETRY_MAX_DELAY,
+                    http_status_codes=_RETRY_STATUS_CODES,
+                )
+            ),
+        )
+
         try:
-            self.vectoriser = genai.Client(
-                **client_kwargs,
-            )
+            # vectorisers with the same settings share one pooled client and its connections
+            self.vectoriser = get_genai_client(**client_kwargs)
         except Exception as e:
             raise ConfigurationError(
                 "Failed to initialise GCP GenAI client.",
                 context={"vectoriser": "gcp", "cause": str(e), "cause_type": type(e).__name__},
             ) from e
 
-    def transform(self, texts: str | list[str]) -> np.ndarray:
-        """Transforms input text(s) into embeddings using the GenAI API.
+    def _embed_request(self, texts: list[str]) -> np.ndarray:
+        """Embeds texts with a single GenAI API request.
 
         Args:
-            texts (str | list[str]): The input text(s) to embed. Can be a
-                single string or a list of strings.
+            texts (list[str]): The texts to embed, no more than the API accepts
+                in one request.
 
         Returns:
-            numpy.ndarray: A 2D array of embeddings, where each row
-                corresponds to an input text.
+            numpy.ndarray: A 2D float32 array of embeddings, one row per text.
 
         Raises:
             `ExternalServiceError`: If the GenAI API request fails.
             `VectorisationError`: If the response format from the GenAI API is
-                unexpected.
+                unexpected, or holds a different number of embeddings than
+                texts sent.
         """
-        # If a single string is passed as arg to texts, convert to list
-        if isinstance(texts, str):
-            texts = [texts]
-
         # The Vertex AI call to embed content
         try:
             embeddings = self.vectoriser.models.embed_content(
@@ -142,7 +191,12 @@ class GcpVectoriser(VectoriserBase):
 
         # Extract embeddings from the response object
         try:
-            result = np.array([res.values for res in embeddings.embeddings])
+            # copy each vector straight into a float32 array, rather than letting NumPy infer a shape and dtype
+            # from the nested Python lists first
+            rows = embeddings.embeddings
+            result = np.empty((len(rows), len(rows[0].values) if rows else 0), dtype=np.float32)
+            for i, res in enumerate(rows):
+                result[i] = res.values
         except Exception as e:
             raise VectorisationError(
                 "Unexpected embedding response format from GCP.",
@@ -154,4 +208,81 @@ class GcpVectoriser(VectoriserBase):
                 },
             ) from e
 
+        # a short response would otherwise misalign every later row of the preallocated result in transform
+        if len(result) != len(texts):
+            raise VectorisationError(
+                "GCP returned a different number of embeddings than texts sent.",
+                context={
+                    "vectoriser": "gcp",
+                    "model": self.model_name,
+                    "n_texts": len(texts),
+                    "n_embeddings": len(result),
+                },
+            )
+
+        return result
+
+    def _embed_texts(self, texts: list[str]) -> np.ndarray:
+        """Embeds texts with the GenAI API, without consulting the embedding cache.
+
+        Args:
+            texts (list[str]): The texts to embed.
+
+        Returns:
+            numpy.ndarray: A 2D float32 array of embeddings, where each row
+                corresponds to an input text.
+
+        Raises:
+            `ExternalServiceError`: If a GenAI API request fails.
+            `VectorisationError`: If the response format from the GenAI API is
+                unexpected, or a response holds a different number of
+                embeddings than texts sent.
+        """
+        chunks = [texts[i : i + _MAX_TEXTS_PER_REQUEST] for i in range(0, len(texts), _MAX_TEXTS_PER_REQUEST)]
+        if len(chunks) <= 1:
+            return self._embed_request(texts)
+
+        # threads rather than asyncio, so transform can still be called from inside a running event loop
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(chunks))) as pool:
+            chunk_embeddings = pool.map(self._embed_request, chunks)
+
+            # fill one preallocated array in request order, rather than building a list of rows to convert;
+            # _embed_request has already checked each chunk holds one embedding per text, so every row is written
+            result = None
+            for start, embeddings in zip(range(0, len(texts), _MAX_TEXTS_PER_REQUEST), chunk_embeddings, strict=True):
+                if result is None:
+                    result = np.empty((len(texts), embeddings.shape[1]), dtype=np.float32)
+                result[start : start + len(embeddings)] = embeddings
+
         return result
+
+    def transform(self, texts: str | list[str]) -> np.ndarray:
+        """Transforms input text(s) into embeddings using the GenAI API.
+
+        Texts are split into requests of at most 250 texts, which are sent
+        concurrently (up to `max_concurrency` at a time) since each request
+        spends most of its time waiting on the network.
+
+        Repeated texts are only embedded once, and texts already held in the
+        embedding cache (see `cache_size`) are not embedded again.
+
+        Args:
+            texts (str | list[str]): The input text(s) to embed. Can be a
+                single string, or a list (or other iterable) of strings.
+
+        Returns:
+            numpy.ndarray: A 2D float32 array of embeddings, where each row
+                corresponds to an input text.
+
+        Raises:
+            `DataValidationError`: If texts is not a string or an iterable of
+                strings.
+            `ExternalServiceError`: If a GenAI API request fails.
+            `VectorisationError`: If the response format from the GenAI API is
+                unexpected.
+        """
+        texts = _coerce_texts(texts)
+
+        if self._embedding_cache is not None:
+            return self._embedding_cache.transform(texts, self._embed_texts)
+        return _embed_unique(texts, self._embed_texts)
@@ -1,11 +1,57 @@
 """A module that provides a wrapper for Huggingface Transformers models to generate text embeddings."""
 
-from numpy import ndarray as np_ndarray
+import os
+
+import numpy as np
 
 from classifai._optional import check_deps
 from classifai.exceptions import ConfigurationError, ExternalServiceError, VectorisationError
 
-from .base import VectoriserBase
+from .base import VectoriserBase, _coerce_texts, _embed_unique, _EmbeddingCache
+
+# execution providers to run an exported model with, fastest first; onnxruntime uses the first one available
+_ONNX_PROVIDERS = ["TensorrtExecutionProvider", "CUDAExecutionProvider", "CPUExecutionProvider"]
+_ONNX_OPSET_VERSION = 17
+
+
+def _export_onnx(model, tokenizer, device, onnx_path: str):
+    """Exports a Huggingface model to ONNX, returning its last hidden state with dynamic batch and sequence axes.
+
+    Args:
+        model (transformers.PreTrainedModel): The model to export.
+        tokenizer (transformers.PreTrainedTokenizer): The model's tokenizer,
+            used to build example inputs.
+        device (torch.device): The device the model is loaded on.
+        onnx_path (str): The local file path to write the ONNX model to.
+    """
+    import torch  # type: ignore
+
+    example_inputs = tokenizer(["classifai"], padding=True, truncation=True, return_tensors="pt").to(device)
+    input_names = list(example_inputs.keys())
+
+    class _LastHiddenState(torch.nn.Module):
+        # the exporter passes inputs positionally, so map them back to the tokenizer's input names
+        def __init__(self):
+            super().__init__()
+            self.model = model
+
+        def forward(self, *inputs):
+            return self.model(**dict(zip(input_names, inputs, strict=True))).last_hidden_state
+
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in [*input_names, "last_hidden_state"]}
+    with torch.inference_mode():
+        torch.onnx.export(
+            _LastHiddenState(),
+            tuple(example_inputs[name] for name in input_names),
+            onnx_path,
+            input_names=input_names,
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic_axes,
+            opset_version=_ONNX_OPSET_VERSION,
+            dynamo=False,
+        )
+    # the exporter can leave the model in training mode, which would switch dropout back on
+    model.eval()
 
 
 class HuggingFaceVectoriser(VectoriserBase):
@@ -24,15 +70,32 @@ class HuggingFaceVectoriser(VectoriserBase):
         model (transformers.PreTrainedModel): The Huggingface model instance.
         device (torch.device): The device (CPU or GPU) on which the model is
             loaded.
+        mixed_precision (bool): Whether the forward pass runs under
+            half-precision autocast. Only ever True on a CUDA device.
+        autocast_dtype (torch.dtype): The half-precision dtype used under
+            autocast - bfloat16 where the GPU supports it, otherwise float16.
+        batch_size (int): The maximum number of texts passed through the model
+            at once.
+        onnx_session (onnxruntime.InferenceSession | None): The ONNX Runtime
+            session used in place of the PyTorch model, or None if the model
+            runs in PyTorch.
+        cache_size (int): The maximum number of text embeddings kept in
+            memory, or 0 if embeddings are not cached.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         model_name,
         device=None,
         model_revision="main",
         tokenizer_kwargs: dict | None = None,
         model_kwargs: dict | None = None,
+        *,
+        mixed_precision: bool = False,
+        batch_size: int = 32,
+        onnx_path: str | None = None,
+        cache_size: int = 0,
+        compile_model: bool = False,
     ):
         """Initialises the HuggingfaceVectoriser with the specified model name and device.
 
@@ -46,17 +109,56 @@ class HuggingFaceVectoriser(VectoriserBase):
                 pass to the tokenizer. Defaults to None.
             model_kwargs (dict): [optional] Additional keyword arguments to
                 pass to the model. Defaults to None.
+            mixed_precision (bool): [optional] Whether to run the model under
+                half-precision autocast when it is on a CUDA device, which lets
+                GPUs with tensor cores embed several times faster. This trades
+                accuracy for speed: the embeddings differ slightly from full
+                precision ones, so a VectorStore should be built and queried
+                with the same setting. Has no effect on CPU. Defaults to False.
+            batch_size (int): [optional] The maximum number of texts passed
+                through the model at once. Texts of similar length are batched
+                together, so little compute is spent on padding. Defaults to 32.
+            onnx_path (str): [optional] A local file path for an ONNX export of
+                the model. If given, the model is run with ONNX Runtime (using
+                TensorRT or CUDA where available), which fuses its layers into
+                fewer, faster kernels. The model is exported to this path first
+                if the file does not exist. Requires the `onnx` extra. Defaults
+                to None.
+            cache_size (int): [optional] The maximum number of text embeddings
+                to keep in memory, so repeated texts are not embedded again.
+                Defaults to 0, which disables the cache.
+            compile_model (bool): [optional] Whether to compile the model with
+                `torch.compile`, which fuses its layers into fewer kernels (and
+                on CUDA, replays them as CUDA graphs). The first batches of
+                each new shape are slower while they compile. Ignored when
+                onnx_path is given. Defaults to False.
 
         Raises:
             `ExternalServiceError`: If the model or tokenizer cannot be loaded.
             `ConfigurationError`: If the model cannot be initialised on the
-                specified device.
+                specified device, if batch_size is not a positive integer, if
+                cache_size is not a non-negative integer, or if the ONNX model
+                cannot be exported or loaded.
         """
         check_deps(["transformers", "torch"], extra="huggingface")
         import torch  # type: ignore
         from transformers import AutoModel, AutoTokenizer  # type: ignore
 
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ConfigurationError(
+                "batch_size must be an integer >= 1.",
+                context={"vectoriser": "huggingface", "batch_size": batch_size},
+            )
+
+        if not isinstance(cache_size, int) or cache_size < 0:
+            raise ConfigurationError(
+                "cache_size must be an integer >= 0.",
+                context={"vectoriser": "huggingface", "cache_size": cache_size},
+            )
+        self.cache_size = cache_size
+        self._embedding_cache = _EmbeddingCache(cache_size) if cache_size > 0 else None
         self.model_name = model_name
+        self.batch_size = batch_size
 
         tokenizer_kwargs = dict(tokenizer_kwargs or {})
         model_kwargs = dict(model_kwargs or {})
@@ -89,6 +191,21 @@ class HuggingFaceVectoriser(VectoriserBase):
 
             self.model.to(self.device)
             self.model.eval()
+
+            if compile_model and onnx_path is None:
+                # dynamic shapes, so the varying batch and sequence lengths of the length-sorted batches don't each
+                # force a recompile; CUDA graphs also remove the per-kernel launch overhead on GPU
+                self.model = torch.compile(
+                    self.model,
+                    dynamic=True,
+                    mode="reduce-overhead" if torch.device(self.device).type == "cuda" else "default",
+                )
+
+            # autocast only pays off on GPU tensor cores; bfloat16 keeps float32's range where the GPU supports it
+            self.mixed_precision = mixed_precision and torch.device(self.device).type == "cuda"
+            self.autocast_dtype = (
+                torch.bfloat16 if self.mixed_precision and torch.cuda.is_bf16_supported() else torch.float16
+            )
         except Exception as e:
             raise ConfigurationError(
                 "Failed to initialise model on device.",
@@ -101,16 +218,54 @@ class HuggingFaceVectoriser(VectoriserBase):
                 },
             ) from e
 
-    def transform(self, texts: str | list[str]) -> np_ndarray:
-        """Transforms input text(s) into embeddings using the Huggingface model.
+        self.onnx_session = None
+        if onnx_path is not None:
+            check_deps(["onnx", "onnxruntime"], extra="onnx")
+            import onnxruntime  # type: ignore
+
+            try:
+                if not os.path.exists(onnx_path):
+                    _export_onnx(self.model, self.tokenizer, self.device, onnx_path)
+
+                available_providers = onnxruntime.get_available_providers()
+                providers = [
+                    # TensorRT builds its engines once per input shape profile, so cache them next to the model
+                    (
+                        provider,
+                        {
+                            "trt_fp16_enable": mixed_precision,
+                            "trt_engine_cache_enable": True,
+                            "trt_engine_cache_path": os.path.dirname(os.path.abspath(onnx_path)),
+                        },
+                    )
+                    if provider == "TensorrtExecutionProvider"
+                    else provider
+                    for provider in _ONNX_PROVIDERS
+                    if provider in available_providers
+                ]
+                self.onnx_session = onnxruntime.InferenceSession(onnx_path, providers=providers)
+            except Exception as e:
+                raise ConfigurationError(
+                    "Failed to export or load the ONNX model.",
+                    context={
+                        "vectoriser": "huggingface",
+                        "model": model_name,
+                        "onnx_path": onnx_path,
+                        "cause": str(e),
+                        "cause_type": type(e).__name__,
+                    },
+                ) from e
+
+    def _embed_batch(self, texts: list[str]) -> np.ndarray:
+        """Embeds a single batch of texts with one forward pass of the model.
 
         Args:
-            texts (str | list[str]): The input text(s) to embed. Can be a
-                single string or a list of strings.
+            texts (list[str]): The texts to embed, padded to the longest text
+                in the batch.
 
         Returns:
-            numpy.ndarray: A 2D array of embeddings, where each row
-                corresponds to an input text.
+            numpy.ndarray: A 2D float32 array of mean-pooled embeddings, one
+                row per text.
 
         Raises:
             `VectorisationError`: If tokenization, model inference, or
@@ -118,13 +273,19 @@ class HuggingFaceVectoriser(VectoriserBase):
         """
         import torch  # type: ignore
 
-        # If a single string is passed as arg to texts, convert to list
-        if isinstance(texts, str):
-            texts = [texts]
-
         # Tokenization / tensor move can fail (e.g., device issues, weird tokenizer config)
         try:
-            inputs = self.tokenizer(texts, padding=True, truncation=True, return_tensors="pt").to(self.device)
+            if self.onnx_session is not None:
+                inputs = self.tokenizer(texts, padding=True, truncation=True, return_tensors="np")
+            else:
+                inputs = self.tokenizer(texts, padding=True, truncation=True, return_tensors="pt")
+                if torch.device(self.device).type == "cuda":
+                    # copying from pinned host memory lets the transfer to the GPU run without blocking the host
+                    inputs = {
+                        name: tensor.pin_memory().to(self.device, non_blocking=True) for name, tensor in inputs.items()
+                    }
+                else:
+                    inputs = inputs.to(self.device)
         except Exception as e:
             raise VectorisationError(
                 "Tokenization failed.",
@@ -139,8 +300,20 @@ class HuggingFaceVectoriser(VectoriserBase):
 
         # Forward pass can fail (OOM, dtype/device mismatch, model bug)
         try:
-            with torch.no_grad():
-                outputs = self.model(**inputs)
+            if self.onnx_session is not None:
+                onnx_inputs = {
+                    onnx_input.name: inputs[onnx_input.name] for onnx_input in self.onnx_session.get_inputs()
+                }
+                token_embeddings = self.onnx_session.run(["last_hidden_state"], onnx_inputs)[0]
+            else:
+                # inference_mode also skips the autograd version tracking that no_grad keeps
+                with (
+                    torch.inference_mode(),
+                    torch.autocast(
+                        torch.device(self.device).type, dtype=self.autocast_dtype, enabled=self.mixed_precision
+                    ),
+                ):
+                    token_embeddings = self.model(**inputs).last_hidden_state
         except Exception as e:
             # RuntimeError is common for CUDA OOM etc.
             raise VectorisationError(
@@ -157,15 +330,20 @@ class HuggingFaceVectoriser(VectoriserBase):
 
         # Pooling / output parsing
         try:
-            token_embeddings = outputs.last_hidden_state
-            attention_mask = inputs["attention_mask"]
-
-            mask = attention_mask.unsqueeze(-1).expand(token_embeddings.size()).float()
-            summed = torch.sum(token_embeddings * mask, dim=1)
-            counts = torch.clamp(mask.sum(dim=1), min=1e-9)
-            mean_pooled = summed / counts
-
-            embeddings = mean_pooled.cpu().numpy()
+            # sum the unmasked tokens as a batched (1, S) x (S, H) product, rather than expanding the mask to the
+            # full (B, S, H) size of the hidden states and multiplying them element-wise; pooling is in float32,
+            # whatever precision the forward pass ran in
+            if self.onnx_session is not None:
+                token_embeddings = token_embeddings.astype(np.float32, copy=False)
+                mask = inputs["attention_mask"].astype(np.float32)
+                summed = np.einsum("bs,bsh->bh", mask, token_embeddings)
+                embeddings = summed / np.maximum(mask.sum(axis=1, keepdims=True), 1e-9)
+            else:
+                token_embeddings = token_embeddings.float()
+                mask = inputs["attention_mask"].to(token_embeddings.dtype)
+                summed = torch.einsum("bs,bsh->bh", mask, token_embeddings)
+                counts = mask.sum(dim=1, keepdim=True).clamp_min(1e-9)
+                embeddings = (summed / counts).cpu().numpy()
         except Exception as e:
             raise VectorisationError(
                 "Failed to compute embeddings from model outputs.",
@@ -179,3 +357,63 @@ class HuggingFaceVectoriser(VectoriserBase):
             ) from e
 
         return embeddings
+
+    def _embed_texts(self, texts: list[str]) -> np.ndarray:
+        """Embeds texts with the Huggingface model, without consulting the embedding cache.
+
+        Args:
+            texts (list[str]): The texts to embed.
+
+        Returns:
+            numpy.ndarray: A 2D float32 array of embeddings, where each row
+                corresponds to an input text.
+
+        Raises:
+            `VectorisationError`: If tokenization, model inference, or
+                embedding extraction fails.
+        """
+        if len(texts) <= self.batch_size:
+            return self._embed_batch(texts)
+
+        # character length is a cheap stand-in for token length, and good enough to group texts for padding
+        order = np.argsort([len(text) for text in texts], kind="stable")
+
+        result = None
+        for start in range(0, len(texts), self.batch_size):
+            batch_positions = order[start : start + self.batch_size]
+            embeddings = self._embed_batch([texts[i] for i in batch_positions])
+            if result is None:
+                result = np.empty((len(texts), embeddings.shape[1]), dtype=np.float32)
+            result[batch_positions] = embeddings
+
+        return result
+
+    def transform(self, texts: str | list[str]) -> np.ndarray:
+        """Transforms input text(s) into embeddings using the Huggingface model.
+
+        Texts are sorted by length and passed through the model in batches of
+        at most `batch_size`, so each batch is only padded to the longest of
+        its similar-length texts. The embeddings are returned in input order.
+
+        Repeated texts are only embedded once, and texts already held in the
+        embedding cache (see `cache_size`) are not embedded again.
+
+        Args:
+            texts (str | list[str]): The input text(s) to embed. Can be a
+                single string, or a list (or other iterable) of strings.
+
+        Returns:
+            numpy.ndarray: A 2D float32 array of embeddings, where each row
+                corresponds to an input text.
+
+        Raises:
+            `DataValidationError`: If texts is not a string or an iterable of
+                strings.
+            `VectorisationError`: If tokenization, model inference, or
+                embedding extraction fails.
+        """
+        texts = _coerce_texts(texts)
+
+        if self._embedding_cache is not None:
+            return self._embedding_cache.transform(texts, self._embed_texts)
+        return _embed_unique(texts, self._embed_texts)
@@ -1,11 +1,17 @@
 """A module for embedding text using a locally-running Ollama server."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
 from classifai._optional import check_deps
-from classifai.exceptions import ExternalServiceError, VectorisationError
+from classifai.exceptions import ConfigurationError, ExternalServiceError, VectorisationError
+
+from .base import VectoriserBase, _coerce_texts, _embed_unique, _EmbeddingCache
 
-from .base import VectoriserBase
+# texts are embedded in chunks of this size, with several chunks in flight so the server is never left idle; small
+# enough that a single VectorStore batch is spread over several of the server's parallel slots
+_TEXTS_PER_REQUEST = 32
 
 
 class OllamaVectoriser(VectoriserBase):
@@ -21,44 +27,67 @@ class OllamaVectoriser(VectoriserBase):
 
     Attributes:
         model_name (str): The name of the local model to use.
+        num_parallel (int): The maximum number of embedding requests sent to
+            the Ollama server at once.
+        cache_size (int): The maximum number of text embeddings kept in
+            memory, or 0 if embeddings are not cached.
     """
 
-    def __init__(self, model_name: str):
+    def __init__(self, model_name: str, *, num_parallel: int = 4, cache_size: int = 0):
         """Initialises the OllamaVectoriser with the specified model name and device.
 
         Args:
             model_name (str): The name of the local model to use.
+            num_parallel (int): [optional] The maximum number of embedding
+                requests sent to the Ollama server at once. Set this to match
+                the server's `OLLAMA_NUM_PARALLEL` setting. Defaults to 4.
+            cache_size (int): [optional] The maximum number of text embeddings
+                to keep in memory, so repeated texts are not embedded again.
+                Defaults to 0, which disables the cache.
+
+        Raises:
+            `ConfigurationError`: If num_parallel is not a positive integer, or
+                if cache_size is not a non-negative integer.
 
         Notes:
             requires an Ollama server to be running locally (`ollama serve`)
         """
         check_deps(["ollama"], extra="ollama")
 
+        if not isinstance(num_parallel, int) or num_parallel < 1:
+            raise ConfigurationError(
+                "num_parallel must be an integer >= 1.",
+                context={"vectoriser": "ollama", "num_parallel": num_parallel},
+            )
+        if not isinstance(cache_size, int) or cache_size < 0:
+            raise ConfigurationError(
+                "cache_size must be an integer >= 0.",
+                context={"vectoriser": "ollama", "cache_size": cache_size},
+            )
+        self.num_parallel = num_parallel
+        self.cache_size = cache_size
+        self._embedding_cache = _EmbeddingCache(cache_size) if cache_size > 0 else None
+
         self.model_name = model_name
 
-    def transform(self, texts: str | list[str]) -> np.ndarray:
-        """Transforms input text(s) into embeddings using the Ollama model.
+    def _embed_request(self, texts: list[str]) -> np.ndarray:
+        """Embeds texts with a single request to the Ollama server.
 
         Args:
-            texts (str | list [str]): The input text(s) to embed. Can be a
-                single string or a list of strings.
+            texts (list[str]): The texts to embed.
 
         Returns:
-            numpy.ndarray: A 2D array of embeddings, where each row corresponds
-                to an input text.
+            numpy.ndarray: A 2D float32 array of embeddings, one row per text.
 
         Raises:
             `ExternalServiceError`: If the Ollama service fails to generate
                 embeddings.
             `VectorisationError`: If embedding extraction from the Ollama
-                response fails.
+                response fails, or the response holds a different number of
+                embeddings than texts sent.
         """
         import ollama  # type: ignore
 
-        # If a single string is passed as arg to texts, convert to list
-        if isinstance(texts, str):
-            texts = [texts]
-
         try:
             response = ollama.embed(model=self.model_name, input=texts)
         except Exception as e:
@@ -73,7 +102,12 @@ class OllamaVectoriser(VectoriserBase):
             ) from e
 
         try:
-            return np.array(response.embeddings)
+            # copy each vector straight into a float32 array, rather than letting NumPy infer a shape and dtype
+            # from the nested Python lists first
+            rows = response.embeddings
+            result = np.empty((len(rows), len(rows[0]) if rows else 0), dtype=np.float32)
+            for i, values in enumerate(rows):
+                result[i] = values
         except Exception as e:
             raise VectorisationError(
                 "Failed to extract embeddings from Ollama response.",
@@ -84,3 +118,83 @@ class OllamaVectoriser(VectoriserBase):
                     "cause_type": type(e).__name__,
                 },
             ) from e
+
+        # a short response would otherwise misalign every later row of the preallocated result in _embed_texts
+        if len(result) != len(texts):
+            raise VectorisationError(
+                "Ollama returned a different number of embeddings than texts sent.",
+                context={
+                    "vectoriser": "ollama",
+                    "model": self.model_name,
+                    "n_texts": len(texts),
+                    "n_embeddings": len(result),
+                },
+            )
+
+        return result
+
+    def _embed_texts(self, texts: list[str]) -> np.ndarray:
+        """Embeds texts with the Ollama server, without consulting the embedding cache.
+
+        Args:
+            texts (list[str]): The texts to embed.
+
+        Returns:
+            numpy.ndarray: A 2D float32 array of embeddings, where each row
+                corresponds to an input text.
+
+        Raises:
+            `ExternalServiceError`: If the Ollama service fails to generate
+                embeddings.
+            `VectorisationError`: If embedding extraction from the Ollama
+                response fails, or a response holds a different number of
+                embeddings than texts sent.
+        """
+        chunks = [texts[i : i + _TEXTS_PER_REQUEST] for i in range(0, len(texts), _TEXTS_PER_REQUEST)]
+        if len(chunks) <= 1:
+            return self._embed_request(texts)
+
+        with ThreadPoolExecutor(max_workers=min(self.num_parallel, len(chunks))) as pool:
+            chunk_embeddings = pool.map(self._embed_request, chunks)
+
+            # fill one preallocated array in request order, rather than building a list of rows to convert;
+            # _embed_request has already checked each chunk holds one embedding per text, so every row is written
+            result = None
+            for start, embeddings in zip(range(0, len(texts), _TEXTS_PER_REQUEST), chunk_embeddings, strict=True):
+                if result is None:
+                    result = np.empty((len(texts), embeddings.shape[1]), dtype=np.float32)
+                result[start : start + len(embeddings)] = embeddings
+
+        return result
+
+    def transform(self, texts: str | list[str]) -> np.ndarray:
+        """Transforms input text(s) into embeddings using the Ollama model.
+
+        Texts are split into requests of at most 32 texts, and up to
+        `num_parallel` requests are sent to the Ollama server at once, so a
+        server with several parallel slots embeds them side by side.
+
+        Repeated texts are only embedded once, and texts already held in the
+        embedding cache (see `cache_size`) are not embedded again.
+
+        Args:
+            texts (str | list[str]): The input text(s) to embed. Can be a
+                single string, or a list (or other iterable) of strings.
+
+        Returns:
+            numpy.ndarray: A 2D float32 array of embeddings, where each row
+                corresponds to an input text.
+
+        Raises:
+            `DataValidationError`: If texts is not a string or an iterable of
+                strings.
+            `ExternalServiceError`: If the Ollama service fails to generate
+                embeddings.
+            `VectorisationError`: If embedding extraction from the Ollama
+                response fails.
+        """
+        texts = _coerce_texts(texts)
+
+        if self._embedding_cache is not None:
+            return self._embedding_cache.transform(texts, self._embed_texts)
+        return _embed_unique(texts, self._embed_texts)
@@ -0,0 +1,19 @@
+import pytest
+
+from .helpers import HashVectoriser, write_csv
+
+
+@pytest.fixture
+def vectoriser():
+    return HashVectoriser()
+
+
+@pytest.fixture
+def knowledgebase_csv(tmp_path):
+    return write_csv(tmp_path / "knowledgebase.csv", 500)
+
+
+@pytest.fixture
+def queries():
+    texts = ["document 3", "document 42", "something else", "farmer", "document 499"]
+    return [str(i) for i in range(len(texts))], texts
@@ -0,0 +1,34 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from classifai.vectorisers import VectoriserBase
+
+
+class HashVectoriser(VectoriserBase):
+    """A deterministic vectoriser mapping each text to a seeded random vector, so tests need no model."""
+
+    def __init__(self, dim: int = 16):
+        self.dim = dim
+
+    def transform(self, texts):
+        if isinstance(texts, str):
+            texts = [texts]
+        rows = []
+        for text in texts:
+            seed = int.from_bytes(hashlib.blake2b(text.encode(), digest_size=4).digest(), "little")
+            rows.append(np.random.default_rng(seed).standard_normal(self.dim))
+        return np.array(rows, dtype=np.float32).reshape(len(rows), self.dim)
+
+
+def write_csv(path, n_rows: int) -> str:
+    """Writes a knowledgebase CSV of n_rows distinct documents and returns its path."""
+    pd.DataFrame(
+        {
+            "label": [str(i % 50) for i in range(n_rows)],
+            "text": [f"document {i}" for i in range(n_rows)],
+            "source": [f"s{i % 3}" for i in range(n_rows)],
+        }
+    ).to_csv(path, index=False)
+    return str(path)
@@ -0,0 +1,201 @@
+import sys
+import types
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from classifai.exceptions import DataValidationError, VectorisationError
+from classifai.vectorisers.base import _coerce_texts, _embed_unique, _EmbeddingCache
+
+
+def _fake_embed(texts):
+    """Embeds each text as [length, sum of code points], so rows can be checked against their texts."""
+    return np.array([[len(text), sum(map(ord, text))] for text in texts], dtype=np.float32).reshape(len(texts), 2)
+
+
+class _RecordingEmbed:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return _fake_embed(texts)
+
+
+# ---- input normalisation, embedding cache and de-duplication
+
+
+def test_coerce_texts_accepts_any_iterable_of_strings():
+    assert _coerce_texts("a") == ["a"]
+    assert _coerce_texts(("a", "b")) == ["a", "b"]
+    assert _coerce_texts(np.array(["a", "b"])) == ["a", "b"]
+
+
+@pytest.mark.parametrize("texts", [["a", ["b"]], ["a", 2], ["a", None], 3])
+def test_coerce_texts_rejects_non_string_texts(texts):
+    with pytest.raises(DataValidationError):
+        _coerce_texts(texts)
+
+
+def test_embed_unique_embeds_each_text_once_in_input_order():
+    embed = _RecordingEmbed()
+    texts = ["b", "a", "b", "ccc", "a"]
+    result = _embed_unique(texts, embed)
+    assert embed.calls == [["b", "a", "ccc"]]
+    np.testing.assert_array_equal(result, _fake_embed(texts))
+
+
+def test_embedding_cache_returns_rows_in_input_order():
+    cache = _EmbeddingCache(max_entries=10)
+    embed = _RecordingEmbed()
+
+    first = cache.transform(["a", "bb", "a", "ccc"], embed)
+    second = cache.transform(["dddd", "bb", "a", "dddd"], embed)
+
+    assert embed.calls == [["a", "bb", "ccc"], ["dddd"]]
+    np.testing.assert_array_equal(first, _fake_embed(["a", "bb", "a", "ccc"]))
+    np.testing.assert_array_equal(second, _fake_embed(["dddd", "bb", "a", "dddd"]))
+
+
+def test_embedding_cache_evicts_least_recently_used():
+    cache = _EmbeddingCache(max_entries=2)
+    embed = _RecordingEmbed()
+    cache.transform(["a", "b"], embed)
+    cache.transform(["a"], embed)  # "b" is now the least recently used
+    cache.transform(["c"], embed)
+    cache.transform(["a", "b"], embed)
+    assert embed.calls[-1] == ["b"]
+
+
+@pytest.mark.parametrize("texts", [["a", ["b"]], ["a", 2], ["a", None]])
+def test_vectoriser_transform_rejects_non_string_texts_with_cache(fake_ollama, texts):
+    from classifai.vectorisers import OllamaVectoriser
+
+    with pytest.raises(DataValidationError):
+        OllamaVectoriser("model", cache_size=10).transform(texts)
+
+
+# ---- Ollama
+
+
+@pytest.fixture
+def fake_ollama(monkeypatch):
+    """Installs a fake ollama module whose embed call can be made to drop the last text of a request."""
+    module = types.ModuleType("ollama")
+    module.short_request_size = None
+    module.requests = []
+
+    def embed(model, input):
+        texts = list(input)
+        module.requests.append(texts)
+        if len(texts) == module.short_request_size:
+            texts = texts[:-1]
+        return SimpleNamespace(embeddings=_fake_embed(texts).tolist())
+
+    module.embed = embed
+    monkeypatch.setitem(sys.modules, "ollama", module)
+    monkeypatch.setattr("classifai.vectorisers.ollama.check_deps", lambda *args, **kwargs: None)
+    return module
+
+
+def test_ollama_chunks_requests_and_keeps_input_order(fake_ollama):
+    from classifai.vectorisers import OllamaVectoriser
+    from classifai.vectorisers.ollama import _TEXTS_PER_REQUEST
+
+    texts = [f"text {i}" for i in range(2 * _TEXTS_PER_REQUEST + 6)]
+    result = OllamaVectoriser("model").transform(texts)
+
+    assert max(len(request) for request in fake_ollama.requests) <= _TEXTS_PER_REQUEST
+    np.testing.assert_array_equal(result, _fake_embed(texts))
+
+
+def test_ollama_raises_on_short_chunk_response(fake_ollama):
+    from classifai.vectorisers import OllamaVectoriser
+    from classifai.vectorisers.ollama import _TEXTS_PER_REQUEST
+
+    fake_ollama.short_request_size = _TEXTS_PER_REQUEST
+    with pytest.raises(VectorisationError):
+        OllamaVectoriser("model").transform([f"text {i}" for i in range(2 * _TEXTS_PER_REQUEST + 6)])
+
+
+def test_ollama_raises_on_short_single_response(fake_ollama):
+    from classifai.vectorisers import OllamaVectoriser
+
+    fake_ollama.short_request_size = 3
+    with pytest.raises(VectorisationError):
+        OllamaVectoriser("model").transform(["a", "b", "c"])
+
+
+# ---- GCP
+
+
+class _FakeGenAIClient:
+    def __init__(self, short_request_size=None):
+        self.short_request_size = short_request_size
+        self.requests = []
+        self.models = self
+
+    def embed_content(self, model, contents, config):
+        texts = list(contents)
+        self.requests.append(texts)
+        if len(texts) == self.short_request_size:
+            texts = texts[:-1]
+        return SimpleNamespace(embeddings=[SimpleNamespace(values=row.tolist()) for row in _fake_embed(texts)])
+
+
+@pytest.fixture
+def gcp_vectoriser(monkeypatch):
+    """Returns a factory for GcpVectorisers backed by a fake GenAI client, recording the client settings used."""
+    pytest.importorskip("google.genai")
+    from classifai.vectorisers import GcpVectoriser
+
+    client_settings = {}
+
+    def make(short_request_size=None, **kwargs):
+        client = _FakeGenAIClient(short_request_size)
+
+        def get_client(**settings):
+            client_settings.update(settings)
+            return client
+
+        monkeypatch.setattr("classifai.vectorisers.gcp.get_genai_client", get_client)
+        return GcpVectoriser(api_key="key", **kwargs), client, client_settings
+
+    return make
+
+
+def test_gcp_chunks_requests_and_keeps_input_order(gcp_vectoriser):
+    from classifai.vectorisers.gcp import _MAX_TEXTS_PER_REQUEST
+
+    vectoriser, client, _ = gcp_vectoriser()
+    texts = [f"text {i}" for i in range(2 * _MAX_TEXTS_PER_REQUEST + 10)]
+    result = vectoriser.transform(texts)
+
+    assert max(len(request) for request in client.requests) <= _MAX_TEXTS_PER_REQUEST
+    np.testing.assert_array_equal(result, _fake_embed(texts))
+
+
+def test_gcp_raises_on_short_response(gcp_vectoriser):
+    from classifai.vectorisers.gcp import _MAX_TEXTS_PER_REQUEST
+
+    vectoriser, _, _ = gcp_vectoriser(short_request_size=_MAX_TEXTS_PER_REQUEST)
+    with pytest.raises(VectorisationError):
+        vectoriser.transform([f"text {i}" for i in range(2 * _MAX_TEXTS_PER_REQUEST + 10)])
+
+
+def test_gcp_retries_transient_failures_by_default(gcp_vectoriser):
+    from classifai.vectorisers.gcp import _RETRY_ATTEMPTS, _RETRY_STATUS_CODES
+
+    _, _, client_settings = gcp_vectoriser()
+    retry_options = client_settings["http_options"].retry_options
+    assert retry_options.attempts == _RETRY_ATTEMPTS
+    assert retry_options.http_status_codes == _RETRY_STATUS_CODES
+
+
+def test_gcp_keeps_caller_http_options(gcp_vectoriser):
+    from google import genai
+
+    http_options = genai.types.HttpOptions(timeout=1000)
+    _, _, client_settings = gcp_vectoriser(http_options=http_options)
+    assert client_settings["http_options"] is http_options
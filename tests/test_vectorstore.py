@@ -0,0 +1,167 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from classifai.exceptions import DataValidationError
+from classifai.indexers import VectorStore, VectorStoreSearchInput
+from classifai.indexers.main import _ANN_MIN_VECTORS, _HNSW_INDEX_FILE
+
+from .helpers import HashVectoriser, write_csv
+
+N_RESULTS = 5
+# approximate and quantised searches must find at least this share of the exact top results
+MIN_INT8_OVERLAP = 0.9
+MIN_HNSW_RECALL = 0.8
+SMALL_STORE_SIZE = 40
+
+
+@pytest.fixture(scope="module")
+def large_knowledgebase_csv(tmp_path_factory):
+    """A knowledgebase large enough for stores with the "hnsw" index type to build an approximate index."""
+    return write_csv(tmp_path_factory.mktemp("large") / "knowledgebase.csv", _ANN_MIN_VECTORS + 500)
+
+
+def _search(store, queries, n_results=N_RESULTS):
+    ids, texts = queries
+    results = store.search(VectorStoreSearchInput({"id": ids, "query": texts}), n_results=n_results)
+    return (
+        results["doc_text"].to_numpy().reshape(len(texts), n_results),
+        results["score"].to_numpy().reshape(len(texts), n_results),
+    )
+
+
+def _brute_force(csv, vectoriser, queries, metric="dot", n_results=N_RESULTS):
+    docs = pd.read_csv(csv, dtype=str)["text"].to_numpy()
+    doc_vectors = vectoriser.transform(docs.tolist())
+    query_vectors = vectoriser.transform(queries[1])
+    if metric == "cosine":
+        doc_vectors /= np.linalg.norm(doc_vectors, axis=1, keepdims=True)
+        query_vectors /= np.linalg.norm(query_vectors, axis=1, keepdims=True)
+    scores = query_vectors @ doc_vectors.T
+    order = np.argsort(-scores, axis=1)[:, :n_results]
+    return docs[order], np.take_along_axis(scores, order, axis=1)
+
+
+def _overlap(found, expected):
+    return np.mean([len(set(a) & set(b)) / len(b) for a, b in zip(found, expected, strict=True)])
+
+
+@pytest.mark.parametrize("metric", ["dot", "cosine"])
+def test_exact_search_matches_brute_force(knowledgebase_csv, vectoriser, queries, metric):
+    store = VectorStore(knowledgebase_csv, "csv", vectoriser, skip_save=True, quiet_mode=True, metric=metric)
+    docs, scores = _search(store, queries)
+    expected_docs, expected_scores = _brute_force(knowledgebase_csv, vectoriser, queries, metric)
+    assert (docs == expected_docs).all()
+    np.testing.assert_allclose(scores, expected_scores, atol=1e-4)
+
+
+@pytest.mark.parametrize("metric", ["dot", "cosine"])
+def test_int8_search_agrees_with_float32(knowledgebase_csv, vectoriser, queries, metric):
+    store = VectorStore(
+        knowledgebase_csv, "csv", vectoriser, skip_save=True, quiet_mode=True, metric=metric, quantise="int8"
+    )
+    docs, scores = _search(store, queries)
+    expected_docs, expected_scores = _brute_force(knowledgebase_csv, vectoriser, queries, metric)
+    assert _overlap(docs, expected_docs) >= MIN_INT8_OVERLAP
+    np.testing.assert_allclose(scores, expected_scores, atol=0.1 if metric == "dot" else 0.02)
+
+
+@pytest.mark.parametrize("n_results", [SMALL_STORE_SIZE, SMALL_STORE_SIZE + 10])
+@pytest.mark.parametrize("quantise", [None, "int8"])
+def test_search_returns_every_document_when_n_results_reaches_store_size(
+    tmp_path, vectoriser, queries, n_results, quantise
+):
+    csv = write_csv(tmp_path / "small.csv", SMALL_STORE_SIZE)
+    store = VectorStore(csv, "csv", vectoriser, skip_save=True, quiet_mode=True, quantise=quantise)
+    ids, texts = queries
+    results = store.search(VectorStoreSearchInput({"id": ids, "query": texts}), n_results=n_results)
+
+    assert len(results) == len(texts) * SMALL_STORE_SIZE
+    expected_docs, _ = _brute_force(csv, vectoriser, queries, n_results=SMALL_STORE_SIZE)
+    docs = results["doc_text"].to_numpy().reshape(len(texts), SMALL_STORE_SIZE)
+    assert all(set(row) == set(expected_row) for row, expected_row in zip(docs, expected_docs, strict=True))
+    ranks = results["rank"].to_numpy().reshape(len(texts), SMALL_STORE_SIZE)
+    assert (ranks == np.arange(1, SMALL_STORE_SIZE + 1)).all()
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"metric": "dot", "quantise": None},
+        {"metric": "dot", "quantise": "int8"},
+        {"metric": "cosine", "quantise": None},
+        {"metric": "cosine", "quantise": "int8"},
+    ],
+)
+def test_from_filespace_round_trip_keeps_options(tmp_path, knowledgebase_csv, vectoriser, queries, options):
+    output_dir = str(tmp_path / "store")
+    store = VectorStore(
+        knowledgebase_csv,
+        "csv",
+        vectoriser,
+        output_dir=output_dir,
+        meta_data={"source": str},
+        quiet_mode=True,
+        **options,
+    )
+    reloaded = VectorStore.from_filespace(output_dir, HashVectoriser(), quiet_mode=True)
+
+    assert {name: getattr(reloaded, name) for name in options} == options
+    assert list(reloaded.meta_data) == ["source"]
+    docs, scores = _search(store, queries)
+    reloaded_docs, reloaded_scores = _search(reloaded, queries)
+    assert (reloaded_docs == docs).all()
+    np.testing.assert_allclose(reloaded_scores, scores, atol=1e-5)
+
+
+@pytest.mark.parametrize("metric", ["dot", "cosine"])
+def test_hnsw_recall_against_exact_search(large_knowledgebase_csv, queries, metric):
+    pytest.importorskip("hnswlib")
+    vectoriser = HashVectoriser(dim=32)
+    exact = VectorStore(large_knowledgebase_csv, "csv", vectoriser, skip_save=True, quiet_mode=True, metric=metric)
+    approximate = VectorStore(
+        large_knowledgebase_csv, "csv", vectoriser, skip_save=True, quiet_mode=True, metric=metric, index="hnsw"
+    )
+    assert approximate._get_ann_index() is not None
+
+    exact_docs, exact_scores = _search(exact, queries, n_results=10)
+    approximate_docs, approximate_scores = _search(approximate, queries, n_results=10)
+    assert _overlap(approximate_docs, exact_docs) >= MIN_HNSW_RECALL
+    np.testing.assert_allclose(approximate_scores[:, 0], exact_scores[:, 0], atol=0.05)
+
+
+@pytest.mark.parametrize("quantise", [None, "int8"])
+def test_from_filespace_loads_saved_hnsw_index(tmp_path, monkeypatch, large_knowledgebase_csv, queries, quantise):
+    pytest.importorskip("hnswlib")
+    output_dir = tmp_path / "store"
+    vectoriser = HashVectoriser(dim=32)
+    store = VectorStore(
+        large_knowledgebase_csv,
+        "csv",
+        vectoriser,
+        output_dir=str(output_dir),
+        quiet_mode=True,
+        metric="cosine",
+        quantise=quantise,
+        index="hnsw",
+    )
+    assert (output_dir / _HNSW_INDEX_FILE).exists()
+
+    def fail_build(doc_matrix):
+        raise AssertionError("the saved HNSW index should be loaded, not rebuilt")
+
+    monkeypatch.setattr("classifai.indexers.main._build_hnsw_index", fail_build)
+    reloaded = VectorStore.from_filespace(str(output_dir), vectoriser, quiet_mode=True)
+
+    assert (reloaded.metric, reloaded.quantise, reloaded.index) == ("cosine", quantise, "hnsw")
+    assert reloaded._get_ann_index() is not None
+    docs, scores = _search(store, queries, n_results=10)
+    reloaded_docs, reloaded_scores = _search(reloaded, queries, n_results=10)
+    assert (reloaded_docs == docs).all()
+    np.testing.assert_allclose(reloaded_scores, scores, atol=1e-5)
+
+
+@pytest.mark.parametrize("column", ["norm", "embeddings_scale", "uuid"])
+def test_meta_data_rejects_reserved_column_names(knowledgebase_csv, vectoriser, column):
+    with pytest.raises(DataValidationError):
+        VectorStore(knowledgebase_csv, "csv", vectoriser, meta_data={column: str}, skip_save=True, quiet_mode=True)